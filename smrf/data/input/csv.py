@@ -62,12 +62,13 @@ class InputCSV:
             df = df.tz_localize(self.time_zone)
             df.columns = [s.upper() for s in df.columns]
 
-            if self.stations is not None:
-                df = df[df.columns[(df.columns).isin(self.stations)]]
-
-            # Only get the desired dates
+            # Only get the desired dates, before selecting the stations so that
+            # only the rows of the run are copied
             df = df[self.start_date:self.end_date]
 
+            if self.stations is not None:
+                df = df.loc[:, df.columns.isin(self.stations)]
+
             if df.empty:
                 raise Exception("No CSV data found for {0}"
                                 "".format(variable))
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime, tzinfo
 from pathlib import Path
 
@@ -7,6 +8,11 @@ import netCDF4
 import numpy.typing as npt
 from cftime import num2date
 
+# The netCDF library is not thread safe. Files that are accessed while the time
+# steps are distributed and the outputs are written in the background are read
+# and written with this lock held.
+NETCDF_LOCK = threading.Lock()
+
 
 class ReadNetCDF:
     """
@@ -77,7 +83,8 @@ class ReadNetCDF:
             f"Reading variable {variable_name} at time {str(timestep)} from file: {self.file.name}"
         )
 
-        data = self.file[variable_name][self.dates.index(timestep.timestamp())]
+        with NETCDF_LOCK:
+            data = self.file[variable_name][self.dates.index(timestep.timestamp())]
 
         if np.isnan(data).any():
             raise ValueError(f"NaN values detected in {variable_name} for {timestep}")
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Tuple
 
+import numexpr as ne
 import numpy as np
 import numpy.typing as npt
 
@@ -61,6 +62,12 @@ class Albedo(VariableBase):
         self.albedo_direct = None
         self.albedo_diffuse = None
         self.burn_mask = None
+        # Single precision copies for the net solar calculation
+        # Key: variable name, Value: (source array, float32 array)
+        self._float32 = {}
+        # Absorbed fraction from the visible and infrared albedo
+        # Tuple of: (albedo_vis, albedo_ir, absorbed fraction)
+        self._absorbed_vis_ir = (None, None, None)
 
         # Get the veg values for the decay methods. Date method uses self.veg
         # Hardy2000 uses self.litter
@@ -86,6 +93,7 @@ class Albedo(VariableBase):
         super().initialize(metadata)
 
         self.load_burn_mask()
+        self.load_veg_decay()
 
         if (
             self.config.get("decay_method", None) is None
@@ -106,6 +114,25 @@ class Albedo(VariableBase):
         else:
             self.burn_mask = self.topo.burn_mask
 
+    def load_veg_decay(self):
+        """
+        Map the vegetation specific decay values of the configured decay method
+        to the topo grid. These do not change between time steps.
+
+        Sets: :py:attr:`veg_max_decay` for the date method and
+        :py:attr:`litter_rate` for the Hardy 2000 method
+        """
+        self.veg_max_decay = None
+        self.litter_rate = None
+
+        decay_method = self.config.get("decay_method", None)
+        if decay_method == "date_method":
+            self.veg_max_decay = albedo.veg_type_values(
+                self.veg, self.veg_type, np.float32
+            )
+        elif decay_method == "hardy2000":
+            self.litter_rate = albedo.veg_type_values(self.litter, self.veg_type)
+
     def distribute(
         self, current_time_step: datetime, cos_z: npt.NDArray, storm_day: npt.NDArray
     ):
@@ -187,7 +214,12 @@ class Albedo(VariableBase):
                 elif self.config["decay_method"] == "hardy2000":
                     self._logger.debug("  Using hardy2000 decay")
                     alb_v, alb_ir = albedo.decay_alb_hardy(
-                        self.litter, self.veg_type, storm_day, alb_v, alb_ir
+                        self.litter,
+                        self.veg_type,
+                        storm_day,
+                        alb_v,
+                        alb_ir,
+                        litter_rate=self.litter_rate,
                     )
 
                 self.albedo_vis = utils.set_min_max(alb_v, self.min, self.max)
@@ -197,6 +229,62 @@ class Albedo(VariableBase):
             self.albedo_vis = np.zeros(storm_day.shape)
             self.albedo_ir = np.zeros(storm_day.shape)
 
+    def as_float32(self, variable: str) -> npt.NDArray:
+        """
+        Get an albedo variable as C-contiguous float32 array. The cast is only done
+        once for each new array that is assigned to the variable and shared by all
+        following calls.
+
+        :param variable: Name of the albedo variable (i.e. albedo_vis)
+
+        :return: float32 version of the variable
+        """
+        source = getattr(self, variable)
+        cached = self._float32.get(variable, None)
+
+        if cached is None or cached[0] is not source:
+            cached = (source, source.astype(np.float32, copy=False, order="C"))
+            self._float32[variable] = cached
+
+        return cached[1]
+
+    def absorbed_from_vis_ir(
+        self, vis_ratio: np.float32, ir_ratio: np.float32
+    ) -> npt.NDArray:
+        """
+        Fraction of the incoming solar radiation that is absorbed based on a weighted
+        broadband albedo from the visible and infrared albedo.
+
+        .. math::
+            1 - (ratio_{vis} * albedo_{vis} + ratio_{ir} * albedo_{ir})
+
+        The result is calculated once for each new pair of visible and infrared
+        albedo arrays and reused until either one changes.
+
+        :param vis_ratio: Weight of the visible albedo
+        :param ir_ratio: Weight of the infrared albedo
+
+        :return: float32 array with the absorbed fraction
+        """
+        albedo_vis, albedo_ir, absorbed = self._absorbed_vis_ir
+
+        if albedo_vis is not self.albedo_vis or albedo_ir is not self.albedo_ir:
+            params = {
+                "VIS_RATIO": vis_ratio,
+                "IR_RATIO": ir_ratio,
+                "MAX_ALBEDO": self.MAX_ALBEDO,
+                "albedo_vis": self.as_float32(self.ALBEDO_VIS),
+                "albedo_ir": self.as_float32(self.ALBEDO_IR),
+            }
+            absorbed = ne.evaluate(
+                "MAX_ALBEDO - (VIS_RATIO * albedo_vis + IR_RATIO * albedo_ir)",
+                local_dict=params,
+                casting="safe",
+            )
+            self._absorbed_vis_ir = (self.albedo_vis, self.albedo_ir, absorbed)
+
+        return absorbed
+
     def date_method(
         self,
         alb_v: npt.NDArray,
@@ -246,6 +334,7 @@ class Albedo(VariableBase):
             self.config["date_method_decay_power"],
             alb_v,
             alb_ir,
+            max_decay=self.veg_max_decay,
         )
 
         if self.config.get("post_fire", False):
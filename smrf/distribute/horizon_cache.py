@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+
+class HorizonCache:
+    """
+    Horizon angles by solar azimuth that are re-used between time steps for
+    the terrain shading of the solar distribution classes. Only the most
+    recently used grids are kept.
+
+    :param resolution: Degrees the solar azimuth is rounded to before looking
+        up the horizon angles. A value of 0 uses the azimuth unchanged and
+        keeps no grids, as the exact azimuth does not repeat between time steps.
+    """
+
+    # Number of horizon angle grids kept for re-use between time steps
+    SIZE = 96
+
+    def __init__(self, resolution: float = 0.0):
+        self.resolution = resolution
+
+        # Horizon angles by solar azimuth, least recently used first
+        self._horizon_angles = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._horizon_angles)
+
+    def __contains__(self, azimuth: float) -> bool:
+        return azimuth in self._horizon_angles
+
+    def azimuth(self, azimuth: float) -> float:
+        """
+        Azimuth to calculate the horizon angles for. Rounded to the configured
+        resolution, or unchanged when that is not set.
+
+        :param azimuth: Solar azimuth angle
+        :return: Azimuth used for the horizon angles
+        """
+        if self.resolution > 0:
+            return round(azimuth / self.resolution) * self.resolution
+
+        return azimuth
+
+    def get(self, azimuth: float) -> Optional[np.ndarray]:
+        """
+        :param azimuth: Azimuth from :py:meth:`azimuth`
+        :return: Cached horizon angles or None when not calculated yet
+        """
+        return self._horizon_angles.get(azimuth)
+
+    def add(self, azimuth: float, horizon_angles: Optional[np.ndarray]) -> None:
+        """
+        Keep the horizon angles for the given azimuth and drop the least recently
+        used ones beyond :py:attr:`SIZE`. Nothing is kept when no horizon angles
+        were calculated or the azimuth is not rounded.
+
+        :param azimuth: Azimuth the horizon angles were calculated for
+        :param horizon_angles: Calculated horizon angles
+        """
+        if horizon_angles is None or self.resolution <= 0:
+            return
+
+        self._horizon_angles[azimuth] = horizon_angles
+        self._horizon_angles.move_to_end(azimuth)
+
+        while len(self._horizon_angles) > self.SIZE:
+            self._horizon_angles.popitem(last=False)
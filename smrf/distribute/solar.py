@@ -8,6 +8,7 @@ from smrf.envphys.solar import cloud, toporad, vegetation
 from smrf.utils import utils
 from smrf.distribute.albedo import Albedo
 
+from .horizon_cache import HorizonCache
 from .variable_base import VariableBase
 
 
@@ -146,6 +147,11 @@ class Solar(VariableBase):
 
     def __init__(self, config, topo):
         super().__init__(config, topo)
+
+        self.horizon_cache = HorizonCache(
+            self.config.get("horizon_resolution", 0.0)
+        )
+
         self.init_empty_variables()
 
     def init_empty_variables(self):
@@ -227,6 +233,10 @@ class Solar(VariableBase):
         if cos_z > 0:
             self.cloud_factor = cloud_factor.copy()
 
+            # The azimuth is only used for the terrain shading, which allows
+            # re-using horizon angles from previous time steps
+            azimuth = self.horizon_cache.azimuth(azimuth)
+
             # Clear sky radiation
             self.clear_ir_beam, self.clear_ir_diffuse, horizon_angles = (
                 self.calc_stoporad(
@@ -236,8 +246,10 @@ class Solar(VariableBase):
                     azimuth,
                     albedo.albedo_ir,
                     IR_WAVELENGTHS,
+                    self.horizon_cache.get(azimuth),
                 )
             )
+            self.horizon_cache.add(azimuth, horizon_angles)
 
             self.ir_beam = self.clear_ir_beam.copy()
             self.ir_diffuse = self.clear_ir_diffuse.copy()
@@ -332,7 +344,9 @@ class Solar(VariableBase):
         )
 
         ## Correct diffuse
-        self.vis_diffuse = vegetation.solar_veg_diffuse(self.vis_diffuse, self.veg_tau)
+        self.vis_diffuse = vegetation.solar_veg_diffuse(
+            self.vis_diffuse, self.veg_tau, out=self.vis_diffuse
+        )
 
         # IR
         ## Correct beam
@@ -341,7 +355,9 @@ class Solar(VariableBase):
         )
 
         ## Correct diffuse
-        self.ir_diffuse = vegetation.solar_veg_diffuse(self.ir_diffuse, self.veg_tau)
+        self.ir_diffuse = vegetation.solar_veg_diffuse(
+            self.ir_diffuse, self.veg_tau, out=self.ir_diffuse
+        )
 
     def calc_net(self, albedo: Albedo) -> None:
         """
@@ -10,6 +10,7 @@ from smrf.envphys.solar.net_solar import NetSolar
 from smrf.envphys.solar.toporad import mask_for_shade
 from smrf.envphys.solar.toposplit import TopoSplit
 
+from .horizon_cache import HorizonCache
 from .variable_base import VariableBase
 
 
@@ -45,6 +46,8 @@ class SolarHRRR(VariableBase):
 
     # Minimum value to calculate radiation for
     MIN_RADIATION = 1
+    # Precision of the total and net solar radiation
+    DTYPE = np.float32
 
     OUTPUT_PREFIX = "solar_"
     OUTPUT_VARIABLES = {
@@ -88,6 +91,10 @@ class SolarHRRR(VariableBase):
             self.sky_view_factor, self.MIN_RADIATION, self.threads
         )
 
+        self.horizon_cache = HorizonCache(
+            self.config.get("horizon_resolution", 0.0)
+        )
+
         # Class attributes holding output data
         self.solar_ghi_vis = None
         self.solar_dni = None
@@ -156,23 +163,21 @@ class SolarHRRR(VariableBase):
         """
         self._logger.debug("%s Distributing HRRR solar" % timestep)
 
-        # Skip calculations if the sun is down
-        if cos_z <= 0:
-            empty = np.zeros_like(self.sky_view_factor)
-            self.solar_ghi_vis = empty
-            self.solar_dni = empty
-            self.solar_dhi = empty
-            self.solar_k = empty
-            self.hrrr_solar = empty
-            self.direct = empty
-            self.diffuse = empty
-            self.net_solar = empty
+        # Skip calculations if the sun is down or no pixel has enough radiation
+        if cos_z <= 0 or self.below_min_radiation(hrrr_data):
+            self.set_no_radiation()
 
             return
 
-        illumination_angles, _horizon_angles = mask_for_shade(
-            cos_z, azimuth, illumination_angles, self.topo
+        azimuth = self.horizon_cache.azimuth(azimuth)
+        illumination_angles, horizon_angles = mask_for_shade(
+            cos_z,
+            azimuth,
+            illumination_angles,
+            self.topo,
+            self.horizon_cache.get(azimuth),
         )
+        self.horizon_cache.add(azimuth, horizon_angles)
 
         results = self.toposplit.calculate(
             hrrr_data[self.DSWRF],
@@ -194,9 +199,13 @@ class SolarHRRR(VariableBase):
 
             self.correct_vegetation(illumination_angles)
 
+        # Cast once for the total and the net solar with direct and diffuse albedo
+        self.direct = self.direct.astype(self.DTYPE, copy=False, order="C")
+        self.diffuse = self.diffuse.astype(self.DTYPE, copy=False, order="C")
+
         params = {
-            "direct": self.direct.astype(np.float32, copy=False, order="C"),
-            "diffuse": self.diffuse.astype(np.float32, copy=False, order="C"),
+            "direct": self.direct,
+            "diffuse": self.diffuse,
         }
         self.hrrr_solar = ne.evaluate(
             "direct + diffuse", local_dict=params, casting="safe"
@@ -204,23 +213,58 @@ class SolarHRRR(VariableBase):
 
         self.calculate_net_solar(albedo)
 
+    def below_min_radiation(self, hrrr_data: dict) -> bool:
+        """
+        Check whether any of the HRRR radiation variables has no value above
+        :py:attr:`MIN_RADIATION`. TopoSplit only calculates pixels where all
+        three are above, which leaves all results at 0 in that case.
+
+        :param hrrr_data: Dictionary of loaded and interpolated HRRR data
+        :return: True when no pixel has enough radiation
+        """
+        return any(
+            hrrr_data[variable].max() <= self.MIN_RADIATION
+            for variable in self.GRIB_VARIABLES
+        )
+
+    def set_no_radiation(self) -> None:
+        """
+        Set all output attributes to a grid of zeros.
+        """
+        empty = self._scratch("empty", self.sky_view_factor, self.DTYPE)
+        empty.fill(0)
+        self.solar_ghi_vis = empty
+        self.solar_dni = empty
+        self.solar_dhi = empty
+        self.solar_k = empty
+        self.hrrr_solar = empty
+        self.direct = empty
+        self.diffuse = empty
+        self.net_solar = empty
+
     def calculate_net_solar(self, albedo: Albedo) -> None:
         """
         Calculate net solar based on the set instance variable in the Albedo class.
 
         :param albedo: Instance of :py:class:`smrf.distribute.albedo.Albedo`
         """
+        net_solar = self._scratch("net_solar", self.hrrr_solar, self.DTYPE)
+
         if albedo.albedo_vis is not None and albedo.albedo_ir is not None:
             self._logger.debug("Calculating net solar using vis and ir albedo")
-            self.net_solar = NetSolar.broadband_from_vis_ir(self.hrrr_solar, albedo)
+            self.net_solar = NetSolar.broadband_from_vis_ir(
+                self.hrrr_solar, albedo, out=net_solar
+            )
         elif albedo.albedo_diffuse is not None and albedo.albedo_direct is not None:
             self._logger.debug("Calculating net solar using diffuse and direct albedo")
             self.net_solar = NetSolar.albedo_diffuse_and_direct(
-                direct=self.direct, diffuse=self.diffuse, albedo=albedo
+                direct=self.direct, diffuse=self.diffuse, albedo=albedo, out=net_solar
             )
         elif albedo.albedo is not None:
             self._logger.debug("Calculating net solar using broadband albedo")
-            self.net_solar = NetSolar.broadband_albedo(self.hrrr_solar, albedo)
+            self.net_solar = NetSolar.broadband_albedo(
+                self.hrrr_solar, albedo, out=net_solar
+            )
         else:
             raise RuntimeError("Albedo variables are not set")
 
@@ -234,4 +278,6 @@ class SolarHRRR(VariableBase):
         self.direct = vegetation.solar_veg_beam(
             self.direct, self.veg_height, illumination_angles, self.veg_k
         )
-        self.diffuse = vegetation.solar_veg_diffuse(self.diffuse, self.veg_tau)
+        self.diffuse = vegetation.solar_veg_diffuse(
+            self.diffuse, self.veg_tau, out=self.diffuse
+        )
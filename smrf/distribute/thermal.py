@@ -1,8 +1,10 @@
+from types import MappingProxyType
+
+import numexpr as ne
 import numpy as np
 from smrf.envphys.constants import STEF_BOLTZ
 from smrf.envphys.core import envphys_c
 from smrf.envphys.thermal import clear_sky, cloud, vegetation
-from smrf.utils import utils
 
 from .variable_base import VariableBase
 
@@ -160,6 +162,20 @@ class Thermal(VariableBase):
         },
     }
 
+    # Configuration option to the method calculating the value
+    CLEAR_SKY_METHODS = MappingProxyType({
+        "marks1979": "_clear_sky_marks1979",
+        "dilley1998": "_clear_sky_dilley1998",
+        "prata1996": "_clear_sky_prata1996",
+        "angstrom1918": "_clear_sky_angstrom1918",
+    })
+    CLOUD_METHODS = MappingProxyType({
+        "garen2005": "_cloud_garen2005",
+        "unsworth1975": "_cloud_unsworth1975",
+        "kimball1982": "_cloud_kimball1982",
+        "crawford1999": "_cloud_crawford1999",
+    })
+
     def __init__(self, config, topo):
         super().__init__(config=config, topo=topo)
 
@@ -169,8 +185,12 @@ class Thermal(VariableBase):
 
         if self.correct_cloud:
             self.cloud_method = self.config["cloud_method"]
+            self._cloud_correction = getattr(
+                self, self.CLOUD_METHODS[self.cloud_method]
+            )
 
         self.clear_sky_method = self.config["clear_sky_method"]
+        self._clear_sky = getattr(self, self.CLEAR_SKY_METHODS[self.clear_sky_method])
 
     def distribute(
         self,
@@ -207,56 +227,36 @@ class Thermal(VariableBase):
             sky_view_factor = self.sky_view_factor
 
         # calculate clear sky thermal
-        if self.clear_sky_method == "marks1979":
-            cth = np.zeros_like(air_temp, dtype=np.float64)
-            envphys_c.ctopotherm(
-                air_temp,
-                dew_point,
-                self.dem,
-                sky_view_factor,
-                cth,
-                self.threads,
-            )
-
-        elif self.clear_sky_method == "dilley1998":
-            cth = clear_sky.Dilly1998(air_temp, vapor_pressure / 1000)
-
-        elif self.clear_sky_method == "prata1996":
-            cth = clear_sky.Prata1996(air_temp, vapor_pressure / 1000)
-
-        elif self.clear_sky_method == "angstrom1918":
-            cth = clear_sky.Angstrom1918(air_temp, vapor_pressure / 1000)
+        cth = self._clear_sky(air_temp, vapor_pressure, dew_point, sky_view_factor)
 
         # terrain factor correction
         if (sky_view_factor is not None) and (self.clear_sky_method != "marks1979"):
             # apply (emiss * skvfac) + (1.0 - skvfac) to the longwave
-            cth = (
-                cth * sky_view_factor
-                + (1.0 - sky_view_factor) * STEF_BOLTZ * air_temp**4
+            cth = ne.evaluate(
+                "cth * sky_view_factor "
+                "+ (1.0 - sky_view_factor) * STEF_BOLTZ * air_temp**4",
+                local_dict={
+                    "cth": cth,
+                    "sky_view_factor": sky_view_factor,
+                    "air_temp": air_temp,
+                    "STEF_BOLTZ": STEF_BOLTZ,
+                },
             )
 
         # make output variable
-        self.thermal_clear = cth.copy()
+        # Intermediate outputs are only read by the output writer and are marked
+        # read only to share them without a copy
+        cth.setflags(write=False)
+        self.thermal_clear = cth
 
         # correct for the cloud factor
         # ratio of measured/modeled solar indicates the thermal correction
         if self.correct_cloud:
-            if self.cloud_method == "garen2005":
-                cth = cloud.Garen2005(cth, cloud_factor)
-
-            elif self.cloud_method == "unsworth1975":
-                cth = cloud.Unsworth1975(cth, air_temp, cloud_factor)
-
-            elif self.cloud_method == "kimball1982":
-                cth = cloud.Kimball1982(
-                    cth, air_temp, vapor_pressure / 1000, cloud_factor
-                )
-
-            elif self.cloud_method == "crawford1999":
-                cth = cloud.Crawford1999(cth, air_temp, cloud_factor)
+            cth = self._cloud_correction(cth, air_temp, vapor_pressure, cloud_factor)
 
             # make output variable
-            self.thermal_cloud = cth.copy()
+            cth.setflags(write=False)
+            self.thermal_cloud = cth
 
         # correct for vegetation
         if self.correct_veg:
@@ -265,6 +265,60 @@ class Thermal(VariableBase):
             )
 
             # make output variable
-            self.thermal_veg = cth.copy()
-
-        self.thermal = utils.set_min_max(cth, self.min, self.max)
+            cth.setflags(write=False)
+            self.thermal_veg = cth
+
+        # The last calculated step is shared with one of the outputs above and
+        # clipped into a separate grid. Clipping keeps NaN values.
+        self.thermal = np.clip(
+            cth, self.min, self.max, out=self._scratch(self.DISTRIBUTION_KEY, cth)
+        )
+
+    # Clear sky methods
+    # All have the same signature of:
+    #   (air_temp, vapor_pressure, dew_point, sky_view_factor)
+    def _clear_sky_marks1979(
+        self, air_temp, vapor_pressure, dew_point, sky_view_factor
+    ):
+        # topotherm is implemented for double precision and sets every pixel
+        cth = self._scratch("clear_sky", air_temp, dtype=np.float64)
+        envphys_c.ctopotherm(
+            air_temp,
+            dew_point,
+            self.dem,
+            sky_view_factor,
+            cth,
+            self.threads,
+        )
+        return cth
+
+    @staticmethod
+    def _clear_sky_dilley1998(air_temp, vapor_pressure, dew_point, sky_view_factor):
+        return clear_sky.Dilly1998(air_temp, vapor_pressure / 1000)
+
+    @staticmethod
+    def _clear_sky_prata1996(air_temp, vapor_pressure, dew_point, sky_view_factor):
+        return clear_sky.Prata1996(air_temp, vapor_pressure / 1000)
+
+    @staticmethod
+    def _clear_sky_angstrom1918(air_temp, vapor_pressure, dew_point, sky_view_factor):
+        return clear_sky.Angstrom1918(air_temp, vapor_pressure / 1000)
+
+    # Cloud correction methods
+    # All have the same signature of:
+    #   (thermal, air_temp, vapor_pressure, cloud_factor)
+    @staticmethod
+    def _cloud_garen2005(cth, air_temp, vapor_pressure, cloud_factor):
+        return cloud.Garen2005(cth, cloud_factor)
+
+    @staticmethod
+    def _cloud_unsworth1975(cth, air_temp, vapor_pressure, cloud_factor):
+        return cloud.Unsworth1975(cth, air_temp, cloud_factor)
+
+    @staticmethod
+    def _cloud_kimball1982(cth, air_temp, vapor_pressure, cloud_factor):
+        return cloud.Kimball1982(cth, air_temp, vapor_pressure / 1000, cloud_factor)
+
+    @staticmethod
+    def _cloud_crawford1999(cth, air_temp, vapor_pressure, cloud_factor):
+        return cloud.Crawford1999(cth, air_temp, cloud_factor)
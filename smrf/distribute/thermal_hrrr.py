@@ -1,4 +1,5 @@
 import numexpr as ne
+import numpy as np
 import pandas as pd
 
 from smrf.envphys.constants import EMISS_TERRAIN, FREEZE, STEF_BOLTZ
@@ -24,6 +25,27 @@ class ThermalHRRR(VariableBase):
     INI_VARIABLE = "hrrr_thermal"
     GRIB_NAME = "DLWRF"
 
+    # Expressions are compiled once and called with the arrays in the order of
+    # the signature. Note that numexpr uses `float` for single precision.
+    # Sky view factor correction
+    TERRAIN_CORRECTION = ne.NumExpr(
+        "(sky_view_factor * forcing_data) + terrain_emission * air_temp_kelvin_4",
+        signature=[
+            ("sky_view_factor", np.float64),
+            ("forcing_data", np.float64),
+            ("terrain_emission", np.float64),
+            ("air_temp_kelvin_4", np.float64),
+        ],
+    )
+    # Stefan-Boltzmann temperature term with the air temperature in Celsius.
+    # The aggressive optimization evaluates the integer power as multiplications
+    # instead of pow().
+    AIR_TEMP_KELVIN_4 = ne.NumExpr(
+        f"(air_temp + {FREEZE!r}) ** 4",
+        signature=[("air_temp", np.float64)],
+        optimization="aggressive",
+    )
+
     OUTPUT_VARIABLES = {
         "thermal": {
             "units": "watt/m2",
@@ -32,36 +54,79 @@ class ThermalHRRR(VariableBase):
         },
     }
 
+    def __init__(self, config, topo):
+        super().__init__(config, topo)
+
+        # Time invariant terms of the sky view factor correction
+        self._terrain_emission = None
+        # Last seen air temperature and the derived (T_a + FREEZE)^4
+        self._air_temp = None
+        self._air_temp_kelvin_4 = None
+
     def initialize(self, metadata: pd.DataFrame) -> None:
         """
         Trimmed down version of the base class as there is no need to initialize
         the interpolation method.
+
+        Precomputes the terrain emission factor :math:`(1 - V_f) \\epsilon \\sigma`
+        since it does not change between time steps.
         """
         self._logger.debug("Initializing")
         self.metadata = metadata
 
+        self._terrain_emission = (
+            (1 - self.sky_view_factor) * EMISS_TERRAIN * STEF_BOLTZ
+        )
+
+    def air_temp_kelvin_4(self, air_temp: np.ndarray) -> np.ndarray:
+        """
+        Air temperature in Kelvin to the fourth power for the Stefan-Boltzmann law.
+        The result is kept for the last given air temperature array and reused when
+        the same array is passed again within a time step. The values are
+        written to a grid that is reused between time steps.
+
+        :param air_temp: Air temperature in Celsius
+
+        :return: (air_temp + FREEZE)^4
+        """
+        if air_temp is not self._air_temp:
+            self._air_temp_kelvin_4 = self.AIR_TEMP_KELVIN_4(
+                air_temp,
+                casting="safe",
+                out=self._scratch("air_temp_kelvin_4", air_temp, np.float64),
+            )
+            self._air_temp = air_temp
+
+        return self._air_temp_kelvin_4
+
     def distribute(self, date_time, forcing_data, air_temp):
         self._logger.debug("%s Distributing HRRR thermal" % date_time)
 
-        params = {
-            "EMISS_TERRAIN": EMISS_TERRAIN,
-            "FREEZE": FREEZE,
-            "STEF_BOLTZ": STEF_BOLTZ,
-            "air_temp": air_temp,
-            "forcing_data": forcing_data,
-            "sky_view_factor": self.sky_view_factor,
-        }
-
-        self.thermal = ne.evaluate(
-            "(sky_view_factor * forcing_data) + (1 - sky_view_factor) * "
-            "EMISS_TERRAIN * STEF_BOLTZ * (air_temp + FREEZE) ** 4",
-            local_dict=params,
+        # Air temperature grids can be updated in place between time steps
+        self._air_temp = None
+
+        # Calculated in double precision like the topo grids. The precision is
+        # only reduced when writing the output files.
+        self.thermal = self.TERRAIN_CORRECTION(
+            self.sky_view_factor,
+            forcing_data,
+            self._terrain_emission,
+            self.air_temp_kelvin_4(air_temp),
             casting="safe",
+            out=self._scratch(
+                self.DISTRIBUTION_KEY, self._terrain_emission, np.float64
+            ),
         )
 
         if self.config.get("correct_veg", False):
             self._logger.debug("* Adjusting HRRR thermal for vegetation")
 
+            # Corrected in place, each pixel only depends on its own value
             self.thermal = vegetation.thermal_correct_canopy(
-                self.thermal, air_temp, self.veg_tau, self.veg_height
+                self.thermal,
+                air_temp,
+                self.veg_tau,
+                self.veg_height,
+                out=self.thermal,
+                air_temp_kelvin_4=self.air_temp_kelvin_4(air_temp),
             )
@@ -1,9 +1,9 @@
 
+import numexpr as ne
 import numpy as np
 
 from .variable_base import VariableBase
 from smrf.envphys.core import envphys_c
-from smrf.utils import utils
 
 
 class VaporPressure(VariableBase):
@@ -57,6 +57,9 @@ class VaporPressure(VariableBase):
         2. Calculate dew point temperature using
             :mod:`smrf.envphys.core.envphys_c.cdewpt`
         3. Adjust dew point values to not exceed the air temperature
+        4. Calculate the wet bulb temperature as precip temperature when
+            configured. Steps 2 to 4 are combined in
+            :mod:`smrf.envphys.core.envphys_c.cdewpt_wbt`
 
         Args:
             data: Pandas dataframe for a single time step from precip
@@ -70,46 +73,56 @@ class VaporPressure(VariableBase):
         # calculate the vapor pressure
         self._distribute(data)
 
-        # set the limits
-        self.vapor_pressure = utils.set_min_max(self.vapor_pressure,
-                                                self.min,
-                                                self.max)
+        # set the limits, clipping keeps NaN values
+        np.clip(self.vapor_pressure, self.min, self.max,
+                out=self.vapor_pressure)
 
         # calculate the dew point
         self._logger.debug('%s -- Calculating dew point' % data.name)
 
-        # use the core_c to calculate the dew point
-        dew_point_temperature = np.zeros_like(self.vapor_pressure, dtype=np.float64)
-        envphys_c.cdewpt(
-            self.vapor_pressure,
-            dew_point_temperature,
-            self.config["dew_point_tolerance"],
-            self.threads,
+        # use the core_c to calculate the dew point, which sets every pixel
+        dew_point_temperature = self._scratch(
+            "dew_point", self.vapor_pressure, np.float64
         )
 
-        ind = dew_point_temperature >= ta
-
-        if (np.sum(ind) > 0):
-            dew_point_temperature[ind] = ta[ind] - 0.2
-
-        self.dew_point = dew_point_temperature
-
-        # calculate wet bulb temperature
         if self.precip_temp_method == 'wet_bulb':
-            # initialize timestep wet_bulb
-            wet_bulb = np.zeros_like(self.vapor_pressure, dtype=np.float64)
-            # calculate wet_bulb
-            envphys_c.cwbt(
+            # timestep wet_bulb, every pixel is set by cdewpt_wbt
+            wet_bulb = self._scratch("wet_bulb", self.vapor_pressure, np.float64)
+            # calculate the dew point, limited by the air temperature, and the
+            # wet_bulb in one pass over the grid
+            envphys_c.cdewpt_wbt(
+                self.vapor_pressure,
                 ta,
-                dew_point_temperature,
                 self.dem,
+                dew_point_temperature,
                 wet_bulb,
                 self.config["dew_point_tolerance"],
                 self.threads,
             )
-            # # store last time step of wet_bulb
-            # self.wet_bulb_old = wet_bulb.copy()
+            self.dew_point = dew_point_temperature
             # store in precip temp for use in precip
             self.precip_temp = wet_bulb
-        else:
-            self.precip_temp = dew_point_temperature.copy()
+            return
+
+        envphys_c.cdewpt(
+            self.vapor_pressure,
+            dew_point_temperature,
+            self.config["dew_point_tolerance"],
+            self.threads,
+        )
+
+        # dew point can not exceed the air temperature
+        ne.evaluate(
+            "where(dew_point_temperature >= ta, ta - 0.2, dew_point_temperature)",
+            out=dew_point_temperature,
+            local_dict={
+                "dew_point_temperature": dew_point_temperature,
+                "ta": ta,
+            },
+        )
+
+        self.dew_point = dew_point_temperature
+
+        # separate grid as precipitation modifies the precip temp
+        self.precip_temp = self._scratch("precip_temp", dew_point_temperature)
+        np.copyto(self.precip_temp, dew_point_temperature)
@@ -79,6 +79,13 @@ class VariableBase:
         self.metadata = None
         # Externally loaded forcing files if present in the configuration
         self.source_files = None
+        # Reusable grids for calculation results, see :py:meth:`_scratch`
+        self._scratch_buffers = {}
+        # Interpolation of the configured distribution method, see :py:meth:`_initialize`
+        self._interpolate = None
+        # Station data index and the positions of the configured stations in it
+        self._station_index = None
+        self._station_indexer = None
 
         # System wide configurations
         if config is not None:
@@ -216,53 +223,62 @@ class VariableBase:
         """
 
         if "distribution" in self.config.keys():
+            # Station locations as arrays, shared by all interpolation methods
+            station_x = self.metadata.utm_x.values
+            station_y = self.metadata.utm_y.values
+            station_z = self.metadata.elevation.values
+
             if self.distribution_method == InverseDistanceWeighted.CONFIG_KEY:
                 self.idw = InverseDistanceWeighted(
-                    self.metadata.utm_x.values,
-                    self.metadata.utm_y.values,
+                    station_x,
+                    station_y,
                     self.topo.X,
                     self.topo.Y,
-                    mz=self.metadata.elevation.values,
+                    mz=station_z,
                     GridZ=self.topo.dem,
                     power=self.config["idw_power"],
                 )
+                self._interpolate = self._interpolate_idw
 
             elif self.distribution_method == DetrendedKriging.CONFIG_KEY:
                 self.dk = DetrendedKriging(
-                    self.metadata.utm_x.values,
-                    self.metadata.utm_y.values,
-                    self.metadata.elevation.values,
+                    station_x,
+                    station_y,
+                    station_z,
                     self.topo.X,
                     self.topo.Y,
                     self.topo.dem,
                     self.config,
                     self.threads,
                 )
+                self._interpolate = self._interpolate_dk
 
             elif self.distribution_method == Grid.CONFIG_KEY:
                 # linear interpolation between points
                 self.grid = Grid(
                     self.config,
-                    self.metadata.utm_x.values,
-                    self.metadata.utm_y.values,
+                    station_x,
+                    station_y,
                     self.topo.X,
                     self.topo.Y,
-                    mz=self.metadata.elevation.values,
+                    mz=station_z,
                     grid_z=self.topo.dem,
                     mask=self.topo.mask,
                     metadata=self.metadata,
                 )
+                self._interpolate = self._interpolate_grid
 
             elif self.distribution_method == Kriging.CONFIG_KEY:
                 self.kriging = Kriging(
-                    self.metadata.utm_x.values,
-                    self.metadata.utm_y.values,
-                    self.metadata.elevation.values,
+                    station_x,
+                    station_y,
+                    station_z,
                     self.topo.X,
                     self.topo.Y,
                     self.topo.dem,
                     self.config,
                 )
+                self._interpolate = self._interpolate_kriging
 
             else:
                 raise Exception(
@@ -287,41 +303,106 @@ class VariableBase:
         """
         # Subset if necessary
         if self.stations is not None:
-            data = data[self.stations]
-
-        if np.sum(data.isnull()) == data.shape[0]:
-            raise Exception("{}: All data values are NaN".format(self.DISTRIBUTION_KEY))
-
-        if self.distribution_method == InverseDistanceWeighted.CONFIG_KEY:
-            if self.config["detrend"]:
-                v = self.idw.detrendedIDW(
-                    data.values, self.config["detrend_slope"], zeros=zeros
-                )
-            else:
-                v = self.idw.calculateIDW(data.values)
+            data = data.iloc[self._station_positions(data.index)]
 
-        elif self.distribution_method == DetrendedKriging.CONFIG_KEY:
-            v = self.dk.calculate(data.values)
+        values = data.values
 
-        elif self.distribution_method == Grid.CONFIG_KEY:
-            if self.config["detrend"]:
-                v = self.grid.detrended_interpolation(
-                    data, self.config["detrend_slope"], self.config["grid_method"]
-                )
-            else:
-                v = self.grid.calculate_interpolation(
-                    data.values, self.config["grid_method"]
-                )
+        if np.isnan(values).all():
+            raise Exception("{}: All data values are NaN".format(self.DISTRIBUTION_KEY))
 
-        elif self.distribution_method == Kriging.CONFIG_KEY:
-            v, ss = self.kriging.calculate(data.values)
-            setattr(self, "{}_variance".format(self.DISTRIBUTION_KEY), ss)
+        v = self._interpolate(values, zeros)
 
         if other_attribute is not None:
             setattr(self, other_attribute, v)
         else:
             setattr(self, self.DISTRIBUTION_KEY, v)
 
+    def _station_positions(self, index: pd.Index) -> np.ndarray:
+        """
+        Integer positions of the configured stations in the station data. The
+        positions are kept for the last seen index, which is shared by all
+        time steps of the loaded data.
+
+        Args:
+            index: Station names of the data for a time step
+
+        Raises:
+            KeyError: If a configured station is not in the data
+        """
+        if index is self._station_index:
+            return self._station_indexer
+
+        positions = index.get_indexer(self.stations)
+
+        if (positions < 0).any():
+            raise KeyError(
+                "{}: Stations {} not found in the data".format(
+                    self.DISTRIBUTION_KEY,
+                    [s for s, p in zip(self.stations, positions) if p < 0],
+                )
+            )
+
+        self._station_index = index
+        self._station_indexer = positions
+
+        return positions
+
+    # Interpolation methods
+    # All have the same signature of: (values, zeros)
+    # with the station values in the order of the metadata
+    # and return the distributed values for the time step
+    def _interpolate_idw(self, values, zeros):
+        if self.config["detrend"]:
+            return self.idw.detrendedIDW(
+                values, self.config["detrend_slope"], zeros=zeros
+            )
+        return self.idw.calculateIDW(values)
+
+    def _interpolate_dk(self, values, zeros):
+        return self.dk.calculate(values)
+
+    def _interpolate_grid(self, values, zeros):
+        if self.config["detrend"]:
+            return self.grid.detrended_interpolation(
+                values, self.config["detrend_slope"], self.config["grid_method"]
+            )
+        return self.grid.calculate_interpolation(values, self.config["grid_method"])
+
+    def _interpolate_kriging(self, values, zeros):
+        v, ss = self.kriging.calculate(values)
+        setattr(self, "{}_variance".format(self.DISTRIBUTION_KEY), ss)
+        return v
+
+    def _scratch(self, name: str, like: np.ndarray, dtype=None) -> np.ndarray:
+        """
+        Get a buffer owned by this instance to write the results of a calculation
+        into. The buffer is allocated on first request and the same memory is
+        handed out again for each following time step.
+
+        Data in the buffer is only valid until the next request with the same name.
+        This is fine for values that are written to the output before the next
+        time step is distributed.
+
+        Args:
+            name: Unique name of the buffer within this instance
+            like: Array to take the shape (and dtype if not given) from
+            dtype: Data type of the buffer
+
+        Returns:
+            Writable array with undefined content
+        """
+        dtype = np.dtype(like.dtype if dtype is None else dtype)
+        buffer = self._scratch_buffers.get(name, None)
+
+        if buffer is None or buffer.shape != like.shape or buffer.dtype != dtype:
+            buffer = np.empty(like.shape, dtype=dtype)
+            self._scratch_buffers[name] = buffer
+
+        # Results from a previous time step may have been marked read only
+        buffer.setflags(write=True)
+
+        return buffer
+
     def _open_source_files(self, base_path: str) -> None:
         """
         Construct a file path to read files configured via the `source_files' key in
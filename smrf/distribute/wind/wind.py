@@ -1,3 +1,4 @@
+import numexpr as ne
 import numpy as np
 from smrf.utils import utils
 
@@ -106,10 +107,17 @@ class Wind(VariableBase):
                              other_attribute='v_direction_distributed')
 
             # combine u and v to azimuth
-            az = np.arctan2(self.u_direction_distributed,
-                            self.v_direction_distributed)*180/np.pi
-            az[az < 0] = az[az < 0] + 360
-            self.wind_direction = az
+            az = ne.evaluate(
+                "arctan2(u, v) * 180 / pi",
+                local_dict={
+                    "u": self.u_direction_distributed,
+                    "v": self.v_direction_distributed,
+                    "pi": np.pi,
+                },
+            )
+            self.wind_direction = ne.evaluate(
+                "where(az < 0, az + 360, az)", out=az, local_dict={"az": az}
+            )
 
         else:
             self.wind_model.distribute(data_speed, data_direction)
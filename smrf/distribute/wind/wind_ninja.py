@@ -1,8 +1,8 @@
+import hashlib
 import os
 
 import numpy as np
 import pytz
-from scipy.interpolate import interp1d
 
 from smrf.utils import utils
 
@@ -40,6 +40,8 @@ class WindNinjaModel:
             self.wind_ninja_tz = pytz.timezone(self.config["wind_ninja_tz"].title())
 
         self.init_interp = True
+        # File names in each WindNinja output directory
+        self._wind_ninja_files = {}
         self.flatwind = None
         self.dir_round_cell = None
         self.cellmaxus = None
@@ -63,23 +65,48 @@ class WindNinjaModel:
         # convert the SMRF date time to the WindNinja time
         t_file = dt.astimezone(self.wind_ninja_tz)
 
-        f_path = os.path.join(
+        f_dir = os.path.join(
             self.wind_ninja_dir,
             'data{}'.format(dt.strftime(self.DATE_FORMAT)),
             'wind_ninja_data',
-            '{}_{}_{:d}m_{}.asc'.format(
-                self.wind_ninja_pref,
-                t_file.strftime(self.WN_DATE_FORMAT),
-                self.wind_ninja_dxy,
-                file_type
-            ))
-
-        if not os.path.isfile(f_path):
+        )
+        f_name = '{}_{}_{:d}m_{}.asc'.format(
+            self.wind_ninja_pref,
+            t_file.strftime(self.WN_DATE_FORMAT),
+            self.wind_ninja_dxy,
+            file_type
+        )
+        f_path = os.path.join(f_dir, f_name)
+
+        if f_name not in self.wind_ninja_files(f_dir):
             raise ValueError(
                 'WindNinja file does not exist: {}!'.format(f_path))
 
         return f_path
 
+    def wind_ninja_files(self, directory):
+        """Names of the files in a WindNinja output directory. The
+        directory is only listed the first time.
+
+        Arguments:
+            directory {str} -- WindNinja output directory
+
+        Returns:
+            set -- file names in the directory
+        """
+        files = self._wind_ninja_files.get(directory, None)
+
+        if files is None:
+            files = set()
+            if os.path.isdir(directory):
+                files = {
+                    entry.name for entry in os.scandir(directory)
+                    if entry.is_file()
+                }
+            self._wind_ninja_files[directory] = files
+
+        return files
+
     def initialize(self):
         """
         Initialize the model with data
@@ -148,10 +175,53 @@ class WindNinjaModel:
         uv[:, 1] = self.Y.flatten()
         uv[:, 0] = self.X.flatten()
 
-        self.vtx, self.wts = utils.interp_weights(xy, uv, d=2)
+        self.vtx, self.wts = self.interp_weights(xy, uv)
 
         self.init_interp = False
 
+    def interp_weights(self, xy, uv):
+        """
+        Vertices and weights to interpolate from the WindNinja grid to the SMRF
+        grid. With a configured weights file, the weights are loaded from that
+        file when it was written for the same grids. Otherwise they are
+        calculated and written to the file for the next run.
+
+        Arguments:
+            xy: n by 2 array of flattened meshgrid x and y coords of WindNinja grid
+            uv: n by 2 array of flattened meshgrid x and y coords of SMRF grid
+
+        Returns:
+            vertices and weights from :func:`smrf.utils.utils.interp_weights`
+        """
+        weights_file = self.config.get("wind_ninja_weights", None)
+        if weights_file is None:
+            return utils.interp_weights(xy, uv, d=2)
+
+        key = hashlib.sha1(
+            np.ascontiguousarray(xy).tobytes() + np.ascontiguousarray(uv).tobytes()
+        ).hexdigest()
+
+        if os.path.isfile(weights_file):
+            with np.load(weights_file) as weights:
+                if str(weights["key"]) == key:
+                    self.wind_distribution._logger.debug(
+                        "Loading WindNinja interpolation weights from {}".format(
+                            weights_file
+                        )
+                    )
+                    return weights["vtx"], weights["wts"]
+
+        vtx, wts = utils.interp_weights(xy, uv, d=2)
+
+        self.wind_distribution._logger.debug(
+            "Saving WindNinja interpolation weights to {}".format(weights_file)
+        )
+        # Write through a file object, as np.savez appends .npz to names
+        with open(weights_file, "wb") as f:
+            np.savez(f, key=key, vtx=vtx, wts=wts)
+
+        return vtx, wts
+
     def distribute(self, data_speed, data_direction):
         """Distribute the wind for the model
 
@@ -185,13 +255,17 @@ class WindNinjaModel:
 
         # get the ascii files that need converted
         fp_vel = self.wind_ninja_path(t, 'vel')
-        data_vel = np.loadtxt(fp_vel, skiprows=6)
+        data_vel = utils.read_asc_data(fp_vel)
         data_vel_int = data_vel.flatten()
 
+        # Grids are reused between time steps
+        scratch = self.wind_distribution._scratch
+
         # interpolate to the SMRF grid from the WindNinja grid
         g_vel = utils.grid_interpolate(
             data_vel_int, self.vtx,
-            self.wts, self.X.shape)
+            self.wts, self.X.shape,
+            out=scratch("wind_ninja_vel", self.X, np.float64))
 
         # There will be NaN's around the edge, handle those first
         if self.model_dxdy != self.wind_ninja_dxy:
@@ -202,25 +276,36 @@ class WindNinjaModel:
             g_vel = self.fill_data(g_vel)
 
         # log law scale
-        g_vel = g_vel * self.ln_wind_scale
+        g_vel = np.multiply(
+            g_vel, self.ln_wind_scale,
+            out=scratch("wind_ninja_speed", self.X, np.float64))
 
         # wind direction from angle, split into u,v components then interpolate
         fp_ang = self.wind_ninja_path(t, 'ang')
-        data_ang = np.loadtxt(fp_ang, skiprows=6)
-
-        u = np.sin(data_ang * np.pi / 180)
-        v = np.cos(data_ang * np.pi / 180)
-
-        ui = utils.grid_interpolate(
-            u.flatten(), self.vtx, self.wts, self.X.shape)
-        vi = utils.grid_interpolate(
-            v.flatten(), self.vtx, self.wts, self.X.shape)
-
-        uf = self.fill_data(ui)
-        vf = self.fill_data(vi)
-
-        g_ang = np.arctan2(uf, vf) * 180 / np.pi
-        g_ang[g_ang < 0] = g_ang[g_ang < 0] + 360
+        data_ang = utils.read_asc_data(fp_ang)
+
+        # u,v components as the imaginary and real part to interpolate
+        # both with one pass over the weights
+        angle = data_ang * np.pi / 180
+        uv = np.empty(angle.shape, dtype=np.complex128)
+        uv.real = np.cos(angle)
+        uv.imag = np.sin(angle)
+
+        # NaN for both parts outside of the WindNinja grid, a real NaN would
+        # leave the imaginary part at 0
+        uvi = utils.grid_interpolate(
+            uv.flatten(), self.vtx, self.wts, self.X.shape,
+            fill_value=complex(np.nan, np.nan),
+            out=scratch("wind_ninja_uv", self.X, np.complex128))
+
+        uf = self.fill_data(uvi.imag)
+        vf = self.fill_data(uvi.real)
+
+        g_ang = np.arctan2(
+            uf, vf, out=scratch("wind_ninja_direction", self.X, np.float64))
+        np.multiply(g_ang, 180, out=g_ang)
+        np.divide(g_ang, np.pi, out=g_ang)
+        np.add(g_ang, 360, out=g_ang, where=g_ang < 0)
 
         return g_vel, g_ang
 
@@ -245,13 +330,9 @@ class WindNinjaModel:
             Unsuccessful attempt to fill in the edges
         """
         # Fill in the Y-direction
-        grid_values = np.apply_along_axis(
-            self.fill_nan, arr=grid_values, axis=1, x=self.X[0, :]
-        )
+        grid_values = self.fill_nan(grid_values, self.X[0, :], axis=1)
         # Fill in the X-direction
-        grid_values = np.apply_along_axis(
-            self.fill_nan, arr=grid_values, axis=0, x=self.Y[:, 0]
-        )
+        grid_values = self.fill_nan(grid_values, self.Y[:, 0], axis=0)
 
         if np.any(np.isnan(grid_values)):
             raise ValueError('WindNinja data still has NaN values')
@@ -259,30 +340,76 @@ class WindNinjaModel:
         return grid_values
 
     @staticmethod
-    def fill_nan(data, x):
+    def fill_nan(data, x, axis):
         """
-        Function to use with np.apply_along_axis to fill NaN values in a
-        1-d array. Uses scipy interp1d to fill the missing values.
+        Fill NaN values along an axis of a 2-d array. Values between two
+        values are linearly interpolated and values towards the edges are
+        linearly extrapolated from the two closest values, same as scipy
+        interp1d with fill_value='extrapolate'. Vectors along the axis with less
+        than two values are not changed.
 
         Parameters
         ----------
-        data : 1-d numpy array
-            Array passed by np.apply_along_axis
+        data : 2-d numpy array
+            Array to fill
         x : 1-d numpy array
-            Values along the x-Axis
+            Monotonic values along the axis
+        axis : int
+            Axis to fill along
 
         Returns
         -------
         np.array
             New array with NaN filled
         """
-        nan_mask = np.isnan(data)
+        data = np.moveaxis(data, axis, -1)
+        size = data.shape[-1]
+        index = np.arange(size)
+
+        valid = ~np.isnan(data)
+        missing = ~valid & (np.sum(valid, axis=-1, keepdims=True) >= 2)
+
+        # Closest value at or before and at or after each element
+        before = np.maximum.accumulate(np.where(valid, index, -1), axis=-1)
+        after = np.flip(
+            np.minimum.accumulate(
+                np.flip(np.where(valid, index, size), axis=-1), axis=-1
+            ),
+            axis=-1,
+        )
+        before_edge = before == -1
+        after_edge = after == size
+        before = np.clip(before, 0, size - 1)
+        after = np.clip(after, 0, size - 1)
+
+        # Extrapolate from the first two and last two values at the edges
+        first = after[..., :1]
+        last = before[..., -1:]
+        low = np.where(
+            before_edge,
+            first,
+            np.where(
+                after_edge,
+                np.take_along_axis(before, np.maximum(last - 1, 0), axis=-1),
+                before,
+            ),
+        )
+        high = np.where(
+            before_edge,
+            np.take_along_axis(after, np.minimum(first + 1, size - 1), axis=-1),
+            np.where(after_edge, last, after),
+        )
+
+        # Interpolate from the lower to the higher x value
+        descending = x[low] > x[high]
+        low, high = np.where(descending, high, low), np.where(descending, low, high)
+
+        x_low = x[low]
+        y_low = np.take_along_axis(data, low, axis=-1)
+        y_high = np.take_along_axis(data, high, axis=-1)
 
-        # Skip rows where all values are NaN
-        if np.sum(nan_mask) == data.shape[0]:
-            return data
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (y_high - y_low) / (x[high] - x_low)
+            filled = np.where(missing, slope * (x - x_low) + y_low, data)
 
-        values = data[~nan_mask]
-        x_values = x[~nan_mask]
-        func = interp1d(x_values, values, fill_value='extrapolate')
-        return func(x)
+        return np.moveaxis(filled, -1, axis)
@@ -16,20 +16,48 @@ def isint(x):
         return False
 
 
-def growth(t):
+def veg_type_values(
+    values: dict, veg_type: npt.NDArray, dtype=np.float64
+) -> npt.NDArray:
     """
-    Calculate grain size growth
-    From IPW albedo > growth
+    Map vegetation specific values to the topo grid. Pixels with a vegetation
+    type that has no value get the default value.
+
+    The values are mapped with a lookup table over the unique vegetation types
+    of the grid, which is independent of the range of the type values, e.g. a
+    fill value of a masked array.
+
+    Args:
+        values: Values by vegetation type with a 'default' value
+        veg_type: Array of vegetation type from the topo
+        dtype: Data type of the returned grid
+
+    Returns:
+        Array with the value for each pixel
     """
+    veg_type = np.asarray(veg_type, dtype=int)
+    keys, inverse = np.unique(veg_type, return_inverse=True)
 
-    a = 4.0
-    b = 3.0
-    c = 2.0
-    d = 1.0
+    lookup = np.full(keys.shape, values["default"], dtype=dtype)
+    for k, v in values.items():
+        if isint(k):
+            lookup[keys == int(k)] = v
+
+    return lookup[inverse].reshape(veg_type.shape)
 
-    factor = (a + (b * t) + (t * t)) / (c + (d * t) + (t * t)) - 1.0
 
-    return 1.0 - factor
+def growth(t):
+    r"""
+    Calculate grain size growth
+    From IPW albedo > growth
+
+    .. math::
+        1 - \left(\frac{4 + 3t + t^2}{2 + t + t^2} - 1\right)
+    """
+    return ne.evaluate(
+        "1.0 - ((4.0 + 3.0 * t + t * t) / (2.0 + t + t * t) - 1.0)",
+        local_dict={"t": t},
+    )
 
 
 def albedo(
@@ -89,14 +117,17 @@ def albedo(
     dzv = gv * VIS_Z_RF
     dzir = (gir * IR_Z_RF) + IR_Z_0
 
-    # calculate albedo
-    alb_v = alb_v_1
-    alb_ir = alb_ir_1
-
-    # correct if the sun is up
-    ind = cosz > 0.0
-    alb_v[ind] += dzv[ind] * (1.0 - cosz[ind])
-    alb_ir[ind] += dzir[ind] * (1.0 - cosz[ind])
+    # calculate albedo and correct if the sun is up
+    alb_v = ne.evaluate(
+        "where(cosz > 0.0, alb_v_1 + dzv * (1.0 - cosz), alb_v_1)",
+        out=alb_v_1,
+        local_dict={"cosz": cosz, "alb_v_1": alb_v_1, "dzv": dzv},
+    )
+    alb_ir = ne.evaluate(
+        "where(cosz > 0.0, alb_ir_1 + dzir * (1.0 - cosz), alb_ir_1)",
+        out=alb_ir_1,
+        local_dict={"cosz": cosz, "alb_ir_1": alb_ir_1, "dzir": dzir},
+    )
 
     return alb_v, alb_ir
 
@@ -109,6 +140,7 @@ def decay_alb_power(
     pwr: float,
     alb_v: npt.NDArray,
     alb_ir: npt.NDArray,
+    max_decay: npt.NDArray = None,
 ) -> Tuple[npt.NDArray, npt.NDArray]:
     """
     Find a decrease in albedo due to litter accumulation. Decay is based on
@@ -131,25 +163,25 @@ def decay_alb_power(
         pwr: power for power law decay
         alb_v: numpy array of albedo for visible spectrum
         alb_ir: numpy array of albedo for IR spectrum
+        max_decay: Optional float32 grid of the maximum decay from
+            :func:`veg_type_values` to use instead of mapping veg and veg_type
 
     Returns: Tuple
         alb_v_d, alb_ir_d : numpy arrays of decayed albedo
     """
-    decay_rates = np.full(veg_type.shape, veg["default"]).astype(np.float32, order="C")
-
     # Map vegetation-specific decay values to the topo grid
-    for k, v in veg.items():
-        if isint(k):
-            decay_rates[veg_type == int(k)] = v
+    if max_decay is None:
+        max_decay = veg_type_values(veg, veg_type, np.float32)
+
+    decay_rates = max_decay
 
     if current_hours < decay_hours:
         inv_pwr = 1.0 / pwr
-        ne.evaluate(
-            "((current_hours * (decay_rates ** inv_pwr)) / decay_hours) ** pwr",
-            out=decay_rates,
+        decay_rates = ne.evaluate(
+            "((current_hours * (max_decay ** inv_pwr)) / decay_hours) ** pwr",
             local_dict={
                 "current_hours": np.float32(current_hours),
-                "decay_rates": decay_rates,
+                "max_decay": max_decay,
                 "decay_hours": np.float32(decay_hours),
                 "inv_pwr": np.float32(inv_pwr),
                 "pwr": np.float32(pwr),
@@ -162,7 +194,7 @@ def decay_alb_power(
     return alb_v, alb_ir
 
 
-def decay_alb_hardy(litter, veg_type, storm_day, alb_v, alb_ir):
+def decay_alb_hardy(litter, veg_type, storm_day, alb_v, alb_ir, litter_rate=None):
     """
     Find a decrease in albedo due to litter accumulation
     using method from :cite:`Hardy:2000` with storm_day as input.
@@ -185,7 +217,8 @@ def decay_alb_hardy(litter, veg_type, storm_day, alb_v, alb_ir):
         storm_day: numpy array of decimal day since last storm
         alb_v: numpy array of albedo for visible spectrum
         alb_ir: numpy array of albedo for IR spectrum
-        alb_litter: albedo of pure litter
+        litter_rate: Optional grid of the litter rate from
+            :func:`veg_type_values` to use instead of mapping litter and veg_type
 
     Returns:
         tuple:
@@ -199,26 +232,26 @@ def decay_alb_hardy(litter, veg_type, storm_day, alb_v, alb_ir):
     Micah Sandusky
 
     """
-    # array for decimal percent snow coverage
-    sc = np.zeros_like(alb_v)
-    # calculate snow coverage default veg type
-    l_rate = litter["default"]
+    # litter rate based on veg type
+    if litter_rate is None:
+        litter_rate = veg_type_values(litter, veg_type)
     alb_litter = litter["albedo"]
 
-    sc = sc + (1.0 - l_rate) ** (storm_day)
-
-    # calculate snow coverage based on veg type
-    for k, v in litter.items():
-        l_rate = litter[k]
-        if isint(k):
-            sc[veg_type == int(k)] = (1.0 - l_rate) ** (storm_day[veg_type == int(k)])
-
-    # calculate litter coverage
-    lc = np.ones_like(alb_v) - sc
+    # decimal percent snow coverage
+    sc = ne.evaluate(
+        "(1.0 - litter_rate) ** storm_day",
+        local_dict={"litter_rate": litter_rate, "storm_day": storm_day},
+    )
 
-    # weighted average to find decayed albedo
-    alb_v_d = alb_v * sc + alb_litter * lc
-    alb_ir_d = alb_ir * sc + alb_litter * lc
+    # weighted average with the litter coverage to find decayed albedo
+    alb_v_d = ne.evaluate(
+        "alb_v * sc + alb_litter * (1.0 - sc)",
+        local_dict={"alb_v": alb_v, "sc": sc, "alb_litter": alb_litter},
+    )
+    alb_ir_d = ne.evaluate(
+        "alb_ir * sc + alb_litter * (1.0 - sc)",
+        local_dict={"alb_ir": alb_ir, "sc": sc, "alb_litter": alb_litter},
+    )
 
     return alb_v_d, alb_ir_d
 
@@ -249,28 +282,23 @@ def decay_burned(
         alb_v_d, alb_ir_d : numpy arrays of decayed albedo
     """
     # Pre-calculate the exponential decay factor once
-    decay_factor = np.exp(-k_burned * last_snow)
-
-    ne.evaluate(
-        "where(burn_mask == 1, where(alb_v < (alb_v_initial * decay_factor), alb_v, (alb_v_initial * decay_factor)), alb_v)",
-        out=alb_v,
-        local_dict={
-            "burn_mask": burn_mask,
-            "alb_v": alb_v,
-            "alb_v_initial": alb_v_initial,
-            "decay_factor": decay_factor,
-        },
-    )
-    ne.evaluate(
-        "where(burn_mask == 1, where(alb_ir < (alb_ir_initial * decay_factor), alb_ir, (alb_ir_initial * decay_factor)), alb_ir)",
-        out=alb_ir,
-        local_dict={
-            "burn_mask": burn_mask,
-            "alb_ir": alb_ir,
-            "alb_ir_initial": alb_ir_initial,
-            "decay_factor": decay_factor,
-        },
+    decay_factor = ne.evaluate(
+        "exp(-k_burned * last_snow)",
+        local_dict={"k_burned": k_burned, "last_snow": last_snow},
     )
 
+    # Burned pixels take the lower of the current and burn decayed albedo
+    for alb, alb_initial in ((alb_v, alb_v_initial), (alb_ir, alb_ir_initial)):
+        ne.evaluate(
+            "where((burn_mask == 1) & (alb_initial * decay_factor < alb), "
+            "alb_initial * decay_factor, alb)",
+            out=alb,
+            local_dict={
+                "burn_mask": burn_mask,
+                "alb": alb,
+                "alb_initial": alb_initial,
+                "decay_factor": decay_factor,
+            },
+        )
 
     return alb_v, alb_ir
@@ -16,5 +16,10 @@ double dew_pointp(double e, double tol);
 double	zerobr(double a, double b, double t);
 
 /* from iwbt.c */
+#define IWBT_NEGATIVE_TEMP 1	/* air or dew point temperature below 0 K */
+#define IWBT_NO_CONVERGENCE 2	/* wet bulb did not converge in 10 iterations */
+
 void iwbt(int ngrid, double *ta, double *td,	double *z, int nthreads, double tol,	double *tw);
 double wetbulb(double	ta,	double dpt, double press, double tol);
+int wetbulb_status(double ta, double dpt, double press, double tol, double *tw);
+int dewpt_iwbt(int ngrid, double *ea, double *ta, double *z, int nthreads, double tol, double *dpt, double *tw);
@@ -19,6 +19,9 @@ cdef extern from "envphys_c.h":
     void topotherm(int ngrid, double *ta, double *tw, double *z, double *skvfac, int nthreads, double *thermal);
     void dewpt(int ngrid, double *ea, int nthreads, double tol, double *dpt);
     void iwbt(int ngrid, double *ta, double *td,	double *z, int nthreads, double tol, double *tw);
+    int dewpt_iwbt(int ngrid, double *ea, double *ta, double *z, int nthreads, double tol, double *dpt, double *tw);
+    int IWBT_NEGATIVE_TEMP
+    int IWBT_NO_CONVERGENCE
 
 
 @cython.boundscheck(False)
@@ -137,3 +140,44 @@ def cwbt(np.ndarray[double, mode="c", ndim=2] ta,
     iwbt(ngrid, &ta_arr[0,0], &td_arr[0,0], &z_arr[0,0], nthreads, tolerance, &tw[0,0])
 
     return None
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+# https://github.com/cython/cython/wiki/tutorials-NumpyPointerToC
+def cdewpt_wbt(np.ndarray[double, mode="c", ndim=2] vp,
+               np.ndarray[double, mode="c", ndim=2] ta,
+               np.ndarray[double, mode="c", ndim=2] z,
+               np.ndarray[double, mode="c", ndim=2] dwpt not None,
+               np.ndarray[double, mode="c", ndim=2] tw not None,
+               float tolerance=0,
+               int nthreads=1):
+    '''
+    Call the function dewpt_iwbt in iwbt.c which calculates the dew point,
+    limited to 0.2 degrees below the air temperature, and the wet bulb
+    temperature in one pass over the grid.
+
+    Args:
+        vp, ta, z
+    Out:
+        dwpt changed in place (dew point temperature)
+        tw changed in place (wet bulb temperature)
+
+    Raises:
+        ValueError: air or dew point temperature below 0 K
+        RuntimeError: wet bulb temperature did not converge
+    '''
+
+    cdef int ngrid
+    cdef int status
+    ngrid = vp.shape[0] * vp.shape[1]
+
+    # call the C function
+    status = dewpt_iwbt(ngrid, &vp[0,0], &ta[0,0], &z[0,0], nthreads, tolerance, &dwpt[0,0], &tw[0,0])
+
+    if status == IWBT_NEGATIVE_TEMP:
+        raise ValueError('Air or dew point temperature is below 0 K')
+    elif status == IWBT_NO_CONVERGENCE:
+        raise RuntimeError('Wet bulb temperature did not converge in 10 iterations')
+
+    return None
@@ -12,11 +12,14 @@
 #define EPS (MOL_H2O/MOL_AIR)	/* Ratio of moleculr weights of water and dry air */
 //#define CONVERGE 0.1		/* Convergence value */
 
-double wetbulb(
+//Solve for the wet or ice bulb temperature, returns IWBT_NO_CONVERGENCE instead
+//of a temperature when there is no solution within 10 iterations
+int wetbulb_status(
 	double	ta,	/* air tempterature (K) */
 	double	dpt,	/* dewpoint temperature (K) */
 	double	press,	/* total air pressure (Pa)  */
-	double	tol)		/* wet_bulb tolerance threshold */
+	double	tol,	/* wet_bulb tolerance threshold */
+	double	*tw)	/* wet or ice bulb temperature (K) (return) */
 {
 	int	i;
 	double	ea;	/* vapor pressure (Pa) */
@@ -69,10 +72,25 @@ double wetbulb(
 		dti = ti0 - ti;
 		i++;
 		if (i > 10){
-			printf("failure to converge in 10 iterations");
-			exit(-1);
+			return(IWBT_NO_CONVERGENCE);
 		}
 	}
+	*tw = ti;
+	return(0);
+}
+
+double wetbulb(
+	double	ta,	/* air tempterature (K) */
+	double	dpt,	/* dewpoint temperature (K) */
+	double	press,	/* total air pressure (Pa)  */
+	double	tol)		/* wet_bulb tolerance threshold */
+{
+	double	ti;	/* wet or ice bulb temperature (K) */
+
+	if (wetbulb_status(ta, dpt, press, tol, &ti) != 0){
+		printf("failure to converge in 10 iterations");
+		exit(-1);
+	}
 	return(ti);
 }
 
@@ -132,3 +150,87 @@ void iwbt (
 		}
 
 }
+
+//Function to calculate the dew point, limited by the air temperature, and the
+//wet bulb temperature of the whole image in one pass over the grid.
+//Returns 0 or the IWBT_* error of a failed pixel, which is left unset.
+int dewpt_iwbt (
+		int ngrid,		/* number of grid points */
+		double *ea,		/* vapor pressure */
+		double *ta,		/* air temperature */
+		double *z,		/* elevation */
+		int nthreads,	/* number of threads for parrallel processing */
+		double tol,		/* dew_point and wet_bulb tolerance threshold */
+		double *dpt,	/* dew point temperature (return) */
+		double *tw)		/* wet bulb temperature (return) */
+{
+	int samp;
+	int		status = 0;	/* error of a failed pixel */
+	int		error;		/* error of the current pixel */
+	float		dpt_p;		/* dew point temperature from vapor pressure (C) */
+	double		td_p;		/* dew point temperature (C)	*/
+	double		tw_p;		/* wet bulb temperature (C)	*/
+	double		ta_p;		/* air temperature (C)		*/
+	double		z_p;		/* elevation (m)		*/
+	double		pa_p;		/* air pressure (pa)		*/
+
+	omp_set_dynamic(0);     // Explicitly disable dynamic teams
+	omp_set_num_threads(nthreads); // Use N threads for all consecutive parallel regions
+
+#pragma omp parallel shared(ngrid, ea, ta, z, status) private(samp, error, dpt_p, ta_p, tw_p, z_p, pa_p, td_p)
+	{
+#pragma omp for
+
+		for (samp=0; samp < ngrid; samp++) {
+			// get pixel values
+			ta_p = ta[samp];
+			z_p = z[samp];
+
+			/*	dew point, same as in dewpt	*/
+			dpt_p = (float) dew_pointp(ea[samp], tol);
+			dpt_p -= FREEZE;
+			td_p = dpt_p;
+
+			/*	dew point can not exceed the air temperature	*/
+			if (td_p >= ta_p) {
+				td_p = ta_p - 0.2;
+			}
+
+			// put back in array
+			dpt[samp] = td_p;
+
+			/*	set pa	*/
+			if (z_p == 0.0) {
+				pa_p = SEA_LEVEL;
+			}
+			else {
+				pa_p = HYSTAT (SEA_LEVEL, STD_AIRTMP, STD_LAPSE,
+							(z_p / 1000.0), GRAVITY, MOL_AIR);
+			}
+
+			/*	convert ta & td to Kelvin	*/
+			ta_p += FREEZE;
+			td_p += FREEZE;
+
+			/*	errors are returned, exiting from a thread would end the process */
+			if(ta_p < 0 || td_p < 0){
+				error = IWBT_NEGATIVE_TEMP;
+			}
+			else {
+				/*	call wetbulb function & fill output buffer	*/
+				error = wetbulb_status(ta_p, td_p, pa_p, tol, &tw_p);
+			}
+
+			if (error) {
+#pragma omp atomic write
+				status = error;
+				continue;
+			}
+
+			// put back in array
+			tw[samp] = tw_p - FREEZE;
+			}
+		}
+
+	return(status);
+}
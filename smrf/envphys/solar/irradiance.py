@@ -1,5 +1,6 @@
 import logging
 import warnings
+from functools import lru_cache
 
 import numpy as np
 from scipy.integrate import IntegrationWarning, quad
@@ -46,12 +47,16 @@ def direct_solar_irradiance(d, w=[0.28, 2.8]):
     return s
 
 
+@lru_cache(maxsize=8)
 def solint(a, b):
     """
     integral of solar constant from wavelengths a to b in micometers
 
     This uses scipy functions which will produce different results
     from the IPW equvialents of 'akcoef' and 'splint'
+
+    The integral only depends on the wavelengths and is calculated once
+    for each range.
     """
 
     # Solar data
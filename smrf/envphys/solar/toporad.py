@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Tuple
 
+import numexpr as ne
 import numpy as np
 from smrf.data.load_topo import Topo
 from smrf.envphys.constants import (
@@ -56,11 +57,17 @@ def mask_for_shade(
     if horizon_angles is None:
         horizon_angles = horizon(azimuth, topo.dem, topo.dx)
 
-    sun_position = np.tan(np.pi / 2 - np.arccos(cos_z))
-    no_sun_mask = np.tan(np.abs(horizon_angles)) > sun_position
-
-    shaded_angles = illumination_angles.copy()
-    shaded_angles[no_sun_mask] = 0
+    # No sun where the horizon is above the sun elevation. Both angles are within
+    # -pi/2 and pi/2, which allows comparing them directly instead of their tangents.
+    sun_elevation = np.pi / 2 - np.arccos(cos_z)
+    shaded_angles = ne.evaluate(
+        "where(abs(horizon_angles) > sun_elevation, 0.0, illumination_angles)",
+        local_dict={
+            "horizon_angles": horizon_angles,
+            "sun_elevation": sun_elevation,
+            "illumination_angles": illumination_angles,
+        },
+    )
 
     return shaded_angles, horizon_angles
 
@@ -81,7 +88,8 @@ def stoporad(
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     The horizon angles are returned for subsequent calls to this method to re-use and
-    save compute time.
+    save compute time. They are only calculated when at least one cell is illuminated
+    and are returned as given otherwise.
 
     Args:
         date_time:               Current processed time step
@@ -121,7 +129,13 @@ def stoporad(
             surface_albedo=np.mean(albedo_surface),
         )
 
-        shade, horizon_angles = mask_for_shade(cos_z, azimuth, illumination_angles, topo, horizon_angles)
+        # Terrain shading only changes the beam radiation on illuminated cells
+        if illumination_angles.any():
+            shade, horizon_angles = mask_for_shade(
+                cos_z, azimuth, illumination_angles, topo, horizon_angles
+            )
+        else:
+            shade = illumination_angles
 
         # Correct topographically
         trad_beam, trad_diff = toporad(
@@ -165,20 +179,32 @@ def toporad(
         tuple: beam and diffuse radiation corrected for terrain
     """
 
-    # adjust diffuse radiation accounting for sky view factor
-    drad = diffuse * sky_view_factor
-
-    # add reflection from adjacent terrain
-    drad = (
-        drad
-        + (diffuse * (1 - sky_view_factor) + beam * cos_z)
-        * terrain_config_factor
-        * surface_albedo
+    # diffuse radiation adjusted for the sky view factor plus the reflection
+    # from adjacent terrain
+    drad = ne.evaluate(
+        "diffuse * sky_view_factor"
+        " + (diffuse * (1.0 - sky_view_factor) + beam * cos_z)"
+        " * terrain_config_factor * surface_albedo",
+        local_dict={
+            "diffuse": diffuse,
+            "beam": beam,
+            "sky_view_factor": sky_view_factor,
+            "terrain_config_factor": terrain_config_factor,
+            "cos_z": cos_z,
+            "surface_albedo": surface_albedo,
+        },
     )
 
     # global radiation is diffuse + incoming_beam * cosine of local
     # illumination * angle
-    rad = drad + beam * illumination_angles
+    rad = ne.evaluate(
+        "drad + beam * illumination_angles",
+        local_dict={
+            "drad": drad,
+            "beam": beam,
+            "illumination_angles": illumination_angles,
+        },
+    )
 
     return rad, drad
 
@@ -202,6 +228,9 @@ class Elevrad:
         surface_albedo (float, optional): Mean surface albedo. Defaults to 0.5.
     """
 
+    # Pressure over the last given DEM, which is the same for every time step
+    _domain_pressure = (None, None)
+
     def __init__(self, elevation, solar_irradiance, cos_z, **kwargs):
         """
         Args:
@@ -233,6 +262,28 @@ class Elevrad:
 
         self.calculate()
 
+    @classmethod
+    def domain_pressure(cls, elevation):
+        """
+        Pressure for each elevation of the DEM. The result is kept for the last
+        given DEM array and re-used while the same array is passed in.
+
+        Args:
+            elevation (np.array): DEM elevations in meters
+
+        Returns:
+            np.array: pressure over the DEM
+        """
+        dem, pressure = cls._domain_pressure
+
+        if dem is not elevation:
+            pressure = hysat(
+                SEA_LEVEL, STD_AIRTMP, STD_LAPSE, elevation / 1000, GRAVITY, MOL_AIR
+            )
+            cls._domain_pressure = (elevation, pressure)
+
+        return pressure
+
     def calculate(self):
         """
         Perform the calculations
@@ -254,9 +305,7 @@ class Elevrad:
 
         # Convert each elevation in look-up table to pressure, then to optical
         # depth over the modeling domain
-        pressure = hysat(
-            SEA_LEVEL, STD_AIRTMP, STD_LAPSE, self.elevation / 1000, GRAVITY, MOL_AIR
-        )
+        pressure = self.domain_pressure(self.elevation)
         tau_domain = self.tau * pressure / reference_pressure
 
         # twostream over the optical depth of the domain
@@ -41,19 +41,14 @@ cdef class TopoSplit:
         const double[:,:] diffuse_horizontal,
         const double cos_z,
         const double[:,:] illumination_angles,
-        double[:,:] results
+        double[:,:,:] results
     ) noexcept nogil:
         cdef:
-            Py_ssize_t col, i
-            double ghi_vis, k_val
-            double results_row[6]  # 6 values per column
+            Py_ssize_t col
+            double ghi_vis, k_val, dhi, dni
 
         # Process each column in this row
         for col in range(self.nx):
-            # Initialize results for this column to 0
-            for i in range(NUM_ARRAYS):
-                results_row[i] = 0.0
-
             # Only calculate for values above the minimum value (set in the initialize)
             # Interpolation in early morning or late evening can cause negative values
             # Keeping all values below the minimum as 0 (the initialized array value)
@@ -63,27 +58,23 @@ cdef class TopoSplit:
             ):
                 # GHI
                 ghi_vis = direct_normal[row_idx, col] * cos_z + diffuse_horizontal[row_idx, col]
-                results_row[0] = ghi_vis
 
                 # K (diffuse fraction)
                 k_val = diffuse_horizontal[row_idx, col] / ghi_vis
-                results_row[1] = k_val
 
                 # DHI and DNI
-                results_row[2] = dswrf[row_idx, col] * k_val
-                results_row[3] = (dswrf[row_idx, col] * (1.0 - k_val)) / cos_z
-
+                dhi = dswrf[row_idx, col] * k_val
+                dni = (dswrf[row_idx, col] * (1.0 - k_val)) / cos_z
+
+                # Each component has its own contiguous plane in the results
+                results[0, row_idx, col] = ghi_vis
+                results[1, row_idx, col] = k_val
+                results[2, row_idx, col] = dhi
+                results[3, row_idx, col] = dni
                 # Direct component
-                results_row[4] = results_row[3] * illumination_angles[row_idx, col]
-
+                results[4, row_idx, col] = dni * illumination_angles[row_idx, col]
                 # Diffuse component
-                results_row[5] = results_row[2] * self._sky_view_factor[row_idx, col]
-
-            # Copy results to the shared results array
-            # Pattern [row_n_col_m_GHI, row_n_col_m_K, row_n_col_m_DHI,
-            #          row_n_col_m_DNI, row_n_col_m_solar, row_n_col_m_net_solar, ...]
-            for i in range(NUM_ARRAYS):
-                results[row_idx * NUM_ARRAYS + i, col] = results_row[i]
+                results[5, row_idx, col] = dhi * self._sky_view_factor[row_idx, col]
 
         return 1
 
@@ -115,9 +106,8 @@ cdef class TopoSplit:
             Dictionary containing the calculated solar components
         """
         cdef:
-            double[:,:] results
-            np.ndarray[double, ndim=2] results_array
-            Py_ssize_t slice_idx
+            double[:,:,:] results
+            np.ndarray[double, ndim=3] results_array
 
         if cos_z <= 0:
             zero_array = np.zeros((self.ny, self.nx), dtype=np.float64)
@@ -130,8 +120,9 @@ cdef class TopoSplit:
                 'diffuse': zero_array.copy()
             }
 
-        # Create one flat array per row to store all calculated components.
-        results_array = np.zeros((self.ny * NUM_ARRAYS, self.nx), dtype=np.float64)
+        # Create one contiguous plane per calculated component so each returned
+        # array is C-contiguous and can be used downstream without a copy.
+        results_array = np.zeros((NUM_ARRAYS, self.ny, self.nx), dtype=np.float64)
         results = results_array
 
         with nogil:
@@ -143,12 +134,12 @@ cdef class TopoSplit:
                     results
                 )
 
-        # Retrieve final result by slicing the results array
+        # Retrieve final result by selecting the component planes
         return {
-            'ghi_vis': results_array[0:results_array.shape[0]:NUM_ARRAYS], # Every 6th row starting from 0
-            'k': results_array[1:results_array.shape[0]:NUM_ARRAYS],
-            'dhi': results_array[2:results_array.shape[0]:NUM_ARRAYS],
-            'dni': results_array[3:results_array.shape[0]:NUM_ARRAYS],
-            'direct': results_array[4:results_array.shape[0]:NUM_ARRAYS],
-            'diffuse': results_array[5:results_array.shape[0]:NUM_ARRAYS]
+            'ghi_vis': results_array[0],
+            'k': results_array[1],
+            'dhi': results_array[2],
+            'dni': results_array[3],
+            'direct': results_array[4],
+            'diffuse': results_array[5]
         }
@@ -39,7 +39,9 @@ def solar_veg_beam(
     )
 
 
-def solar_veg_diffuse(diffuse_radiation: np.ndarray, tau: np.ndarray) -> np.ndarray:
+def solar_veg_diffuse(
+    diffuse_radiation: np.ndarray, tau: np.ndarray, out: np.ndarray = None
+) -> np.ndarray:
     """
     Apply the vegetation correction to the diffuse irradiance using equation (1)
     from Link and Marks (1999)
@@ -54,8 +56,9 @@ def solar_veg_diffuse(diffuse_radiation: np.ndarray, tau: np.ndarray) -> np.ndar
     Args:
         diffuse_radiation: Incoming diffuse radiation
         tau: Optical transmissivity of the canopy
+        out: Optional array to write the result to, which can be diffuse_radiation
 
     Returns:
         Diffuse radiation corrected for vegetation.
     """
-    return ne.evaluate("tau * diffuse_radiation")
+    return ne.evaluate("tau * diffuse_radiation", out=out)
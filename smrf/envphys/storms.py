@@ -1,3 +1,4 @@
+import numexpr as ne
 import numpy as np
 import pandas as pd
 
@@ -99,13 +100,19 @@ def time_since_storm_pixel(precipitation, dpt, perc_snow, storming,
 
     # only reset if stomring and not overly warm
     if storming and dpt.min() < 2.0:
-        # determine location where there is enough mass
-        idx_mass = precipitation >= mass
-        # determine locations where it has snowed
-        idx = perc_snow >= ps_thresh
-
-        # reset the stormDays to zero where the storm is present
-        stormDays[(idx_mass & idx)] = 0
+        # reset the stormDays to zero where the storm is present, which are
+        # locations with enough mass and where it has snowed
+        stormDays[
+            ne.evaluate(
+                "(precipitation >= mass) & (perc_snow >= ps_thresh)",
+                local_dict={
+                    "precipitation": precipitation,
+                    "mass": mass,
+                    "perc_snow": perc_snow,
+                    "ps_thresh": ps_thresh,
+                },
+            )
+        ] = 0
 
     return stormDays
 
@@ -155,22 +162,23 @@ def tracking_by_station(precip, mass_thresh=0.01, steps_thresh=3):
 
     storms = []
 
-    stations = list(precip)
     is_storming = False
     time_steps_since_precip = 0
 
-    for i, row in precip.iterrows():
-        time = pd.Timestamp(i)
+    # Work on the plain values of the data frame, the station totals of a storm
+    # are only converted to a dictionary once the storm ended
+    station_precip = precip.to_numpy()
+    max_precip = precip.max(axis=1).to_numpy()
+
+    for i, time in enumerate(precip.index):
+        time = pd.Timestamp(time)
 
         # Storm Idenificiation
-        if row.max() > mass_thresh:
+        if max_precip[i] > mass_thresh:
             # Start a new storm
             if not is_storming:
-                new_storm = {}
-                new_storm['start'] = time
-                for sta, p in row.iteritems():
-                    new_storm[sta] = 0
-                # Create a new row
+                new_storm = {'start': time}
+                storm_total = np.zeros(len(stations))
                 is_storming = True
 
             time_steps_since_precip = 0
@@ -178,8 +186,7 @@ def tracking_by_station(precip, mass_thresh=0.01, steps_thresh=3):
             new_storm['end'] = time
 
             # Accumulate precip for storm total
-            for sta, mass in row.iteritems():
-                new_storm[sta] += mass
+            storm_total += station_precip[i]
 
         elif is_storming and time_steps_since_precip < steps_thresh:
             new_storm['end'] = time
@@ -188,11 +195,12 @@ def tracking_by_station(precip, mass_thresh=0.01, steps_thresh=3):
 
         if time_steps_since_precip >= steps_thresh and is_storming:
             is_storming = False
+            new_storm.update(zip(stations, storm_total))
             storms.append(new_storm)
-            # print "=="*10 + "> not storming!"
 
     # Append the last storm if we ended during a storm
     if is_storming:
+        new_storm.update(zip(stations, storm_total))
         storms.append(new_storm)
 
     storm_count = len(storms)
@@ -289,16 +297,18 @@ def clip_and_correct(precip, storms, stations: list = None):
     @author: Micah Johnson
     """
 
-    # Specify zeros where were not storming
-    precip_clipped = precip.copy()
-    precip_clipped[:] = 0
+    # Mark the time steps of each storm, including the storm end
+    storm_steps = np.zeros(len(precip.index), dtype=bool)
+    storm_starts = precip.index.searchsorted(storms['start'], side='left')
+    storm_ends = precip.index.searchsorted(storms['end'], side='right')
 
-    for j, storm in storms.iterrows():
+    for storm_start, storm_end in zip(storm_starts, storm_ends):
+        storm_steps[storm_start:storm_end] = True
 
-        storm_start = storm['start']
-        storm_end = storm['end']
-        my_slice = precip.loc[storm_start:storm_end]
-        precip_clipped.loc[storm_start:storm_end] = my_slice
+    # Specify zeros where were not storming
+    precip_clipped = precip.where(
+        np.broadcast_to(storm_steps[:, np.newaxis], precip.shape), 0
+    )
 
     correction = {}
 
@@ -1,3 +1,4 @@
+import numexpr as ne
 import numpy as np
 
 from smrf.envphys.constants import EMISS_TERRAIN, FREEZE, STEF_BOLTZ
@@ -64,12 +65,13 @@ def Dilly1998(ta, ea):
     20170509 Scott Havens
     """
 
-    ta = ta + FREEZE                    # convert to K
-    w = precipitable_water(ta, ea)  # precipitable water
-
-    th = 59.38 + 113.7 * (ta/273.16)**6 + 96.96*np.sqrt(w/25)
-
-    return th
+    # Temperature converted to K and the precipitable water is inlined
+    # as 4650 * ea / ta
+    return ne.evaluate(
+        "59.38 + 113.7 * ((ta + FREEZE) / 273.16) ** 6"
+        " + 96.96 * sqrt(4650 * ea / (ta + FREEZE) / 25)",
+        local_dict={"ta": ta, "ea": ea, "FREEZE": FREEZE},
+    )
 
 
 def Prata1996(ta, ea):
@@ -97,10 +99,11 @@ def Prata1996(ta, ea):
     ta = ta + FREEZE                    # convert to K
     w = precipitable_water(ta, ea)  # precipitable water
 
-    # clear sky emmissivity
-    ec = 1 - (1 + w) * np.exp(-np.sqrt(1.2 + 3*w))
-
-    return calc_long_wave(ec, ta)
+    # clear sky emmissivity and long wave radiation
+    return ne.evaluate(
+        "(1 - (1 + w) * exp(-sqrt(1.2 + 3 * w))) * STEF_BOLTZ * ta ** 4",
+        local_dict={"w": w, "ta": ta, "STEF_BOLTZ": STEF_BOLTZ},
+    )
 
 
 def Angstrom1918(ta, ea):
@@ -125,7 +128,13 @@ def Angstrom1918(ta, ea):
     20170509 Scott Havens
     """
 
-    ta = ta + FREEZE                  # convert to K
-    e = 0.83 - 0.18 * np.power(10, -0.67*ea)
-
-    return calc_long_wave(e, ta)
+    # clear sky emmissivity and long wave radiation with temperature in K
+    return ne.evaluate(
+        "(0.83 - 0.18 * 10 ** (-0.67 * ea)) * STEF_BOLTZ * (ta + FREEZE) ** 4",
+        local_dict={
+            "ta": ta,
+            "ea": ea,
+            "FREEZE": FREEZE,
+            "STEF_BOLTZ": STEF_BOLTZ,
+        },
+    )
@@ -1,7 +1,6 @@
-import numpy as np
+import numexpr as ne
 
 from smrf.envphys.constants import FREEZE, STEF_BOLTZ
-from smrf.envphys.thermal.clear_sky import calc_long_wave
 
 
 def Garen2005(th, cloud_factor):
@@ -24,7 +23,10 @@ def Garen2005(th, cloud_factor):
     20170515 Scott Havens
     """
 
-    return th * (1.485 - 0.488 * cloud_factor)
+    return ne.evaluate(
+        "th * (1.485 - 0.488 * cloud_factor)",
+        local_dict={"th": th, "cloud_factor": cloud_factor},
+    )
 
 
 def Unsworth1975(th, ta, cloud_factor):
@@ -49,16 +51,20 @@ def Unsworth1975(th, ta, cloud_factor):
     20170515 Scott Havens
     """
 
-    c = 1 - cloud_factor
-    ta = ta + FREEZE
-
-    # calculate the clear sky emissivity
-    ec = th/(STEF_BOLTZ * np.power(ta, 4))
-
-    # adjsut the atmospheric emissivity for clouds
-    ea = (1 - 0.84*c) * ec + 0.84*c
-
-    return calc_long_wave(ea, ta)
+    # Clear sky emissivity adjusted for the clouds (c) and converted back
+    # to long wave with the air temperature in Kelvin
+    return ne.evaluate(
+        "((1 - 0.84 * (1 - cloud_factor)) * "
+        "(th / (STEF_BOLTZ * (ta + FREEZE)**4)) + 0.84 * (1 - cloud_factor)) * "
+        "STEF_BOLTZ * (ta + FREEZE)**4",
+        local_dict={
+            "th": th,
+            "ta": ta,
+            "cloud_factor": cloud_factor,
+            "FREEZE": FREEZE,
+            "STEF_BOLTZ": STEF_BOLTZ,
+        },
+    )
 
 
 def Kimball1982(th, ta, ea, cloud_factor):
@@ -93,16 +99,27 @@ def Kimball1982(th, ta, ea, cloud_factor):
 
     20170515 Scott Havens
     """
-    
-    c = 1 - cloud_factor
-    ta = ta + FREEZE
-    Tc = ta - 11
-
-    f8 = -0.6732 + 0.6240 * 10**(-2) * Tc - 0.9140 * 10**(-5) * Tc**2
-    e8z = 0.24 + 2.98 * 10**(-6) * ea**2 * np.exp(3000/ta)
-    t8 = 1 - e8z * (1.4 - 0.4 * e8z)
 
-    return th + calc_long_wave(t8 * c * f8, Tc)
+    e8z = ne.evaluate(
+        "0.24 + 2.98e-6 * ea**2 * exp(3000 / (ta + FREEZE))",
+        local_dict={"ea": ea, "ta": ta, "FREEZE": FREEZE},
+    )
+
+    # Cloud temperature (Tc) is 11 K cooler than the air temperature
+    return ne.evaluate(
+        "th + (1 - e8z * (1.4 - 0.4 * e8z)) * (1 - cloud_factor) * "
+        "(-0.6732 + 0.6240e-2 * (ta + FREEZE - 11) "
+        "- 0.9140e-5 * (ta + FREEZE - 11)**2) * "
+        "STEF_BOLTZ * (ta + FREEZE - 11)**4",
+        local_dict={
+            "th": th,
+            "ta": ta,
+            "e8z": e8z,
+            "cloud_factor": cloud_factor,
+            "FREEZE": FREEZE,
+            "STEF_BOLTZ": STEF_BOLTZ,
+        },
+    )
 
 
 def Crawford1999(th, ta, cloud_factor):
@@ -130,4 +147,13 @@ def Crawford1999(th, ta, cloud_factor):
     20170515 Scott Havens
     """
 
-    return calc_long_wave(1 - cloud_factor, ta + FREEZE) + cloud_factor * th
+    return ne.evaluate(
+        "(1 - cloud_factor) * STEF_BOLTZ * (ta + FREEZE)**4 + cloud_factor * th",
+        local_dict={
+            "th": th,
+            "ta": ta,
+            "cloud_factor": cloud_factor,
+            "FREEZE": FREEZE,
+            "STEF_BOLTZ": STEF_BOLTZ,
+        },
+    )
@@ -1,9 +1,11 @@
 import numexpr as ne
 
-from smrf.envphys.constants import EMISS_VEG, FREEZE, STEF_BOLTZ  # noqa
+from smrf.envphys.constants import EMISS_VEG, FREEZE, STEF_BOLTZ
 
 
-def thermal_correct_canopy(th, ta, tau, veg_height, height_thresh=2):
+def thermal_correct_canopy(
+    th, ta, tau, veg_height, height_thresh=2, out=None, air_temp_kelvin_4=None
+):
     """
     Correct thermal radiation for vegetation for pixels where the height
     is above a threshold. This ensures that the open areas don't get this applied.
@@ -17,13 +19,44 @@ def thermal_correct_canopy(th, ta, tau, veg_height, height_thresh=2):
         veg_height: vegetation height for each pixel
         height_thresh: threshold hold for height to say that there is veg in
             the pixel
+        out: optional array to write the result to, which can be th
+        air_temp_kelvin_4: optional (ta + FREEZE)**4 when already calculated
+            by the caller, ta is not used when given
 
     Returns:
         Vegetation corrected thermal radiation
     """
 
+    if air_temp_kelvin_4 is None:
+        return ne.evaluate(
+            "where(veg_height > height_thresh, "
+            "tau * th + (1 - tau) * (STEF_BOLTZ * EMISS_VEG * (ta + FREEZE)**4), "
+            "th)",
+            out=out,
+            local_dict={
+                "th": th,
+                "ta": ta,
+                "tau": tau,
+                "veg_height": veg_height,
+                "height_thresh": height_thresh,
+                "EMISS_VEG": EMISS_VEG,
+                "FREEZE": FREEZE,
+                "STEF_BOLTZ": STEF_BOLTZ,
+            },
+        )
+
     return ne.evaluate(
         "where(veg_height > height_thresh, "
-        "tau * th + (1 - tau) * (STEF_BOLTZ * EMISS_VEG * (ta + FREEZE)**4), "
-        "th)"
+        "tau * th + (1 - tau) * (STEF_BOLTZ * EMISS_VEG * air_temp_kelvin_4), "
+        "th)",
+        out=out,
+        local_dict={
+            "th": th,
+            "air_temp_kelvin_4": air_temp_kelvin_4,
+            "tau": tau,
+            "veg_height": veg_height,
+            "height_thresh": height_thresh,
+            "EMISS_VEG": EMISS_VEG,
+            "STEF_BOLTZ": STEF_BOLTZ,
+        },
     )
@@ -21,10 +21,12 @@ Example:
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from os.path import abspath, join
 
 import netCDF4
+import numexpr as ne
 import pandas as pd
 import pytz
 from inicheck.config import UserConfig
@@ -32,6 +34,7 @@ from inicheck.output import generate_config, print_config_report
 from inicheck.tools import check_config, get_user_config
 from smrf.data import InputData, Topo
 from smrf.data.input import GriddedInput, InputGribHRRR
+from smrf.data.read_netcdf import NETCDF_LOCK
 from smrf.distribute import (
     AirTemperature,
     Albedo,
@@ -114,6 +117,10 @@ class SMRF:
         for k, v in self.config["system"].items():
             setattr(self, k, v)
 
+        # Limit numexpr to the configured threads. This is a process wide
+        # setting that applies to all numexpr calls of the distribution.
+        ne.set_num_threads(self.threads)
+
         self._setup_date_and_time()
 
         # need to align date time
@@ -150,6 +157,14 @@ class SMRF:
         # Attribute to class that holds the loaded forcing data
         self.data = None
 
+        # Background threads while distributing all time steps, see distribute_data
+        self._executor = None
+        self._output_executor = None
+        self._output_future = None
+
+        # Opened HRRR cloud factor file and its time index, see hrrr_cloud_factor
+        self._hrrr_cloud = None
+
         if self.config["system"]["qotw"]:
             self._logger.info(getqotw())
 
@@ -198,25 +213,37 @@ class SMRF:
 
         self.topo = Topo(self.config["topo"])
 
+    def _add_distribution(self, distribution_class, **kwargs) -> None:
+        """
+        Enqueue a distribution class unless it is already present. Variables are
+        required by several others and are only initialized once.
+
+        Args:
+            distribution_class: Class of the variable to distribute
+            kwargs: Additional arguments for the class initialization
+        """
+        if distribution_class.DISTRIBUTION_KEY not in self.distribute:
+            self.distribute[distribution_class.DISTRIBUTION_KEY] = distribution_class(
+                config=self.config, topo=self.topo, **kwargs
+            )
+
     def distribute_precip(self) -> None:
         """
         Helper method to streamline enqueuing precip. This variables has a lot of
         dependencies and is required for by others such as albedo.
         """
-        init_args = dict(config=self.config, topo=self.topo)
-
         # Need air temp and vapor pressure for precip phase
-        self.distribute[AirTemperature.DISTRIBUTION_KEY] = AirTemperature(**init_args)
-        self.distribute[VaporPressure.DISTRIBUTION_KEY] = VaporPressure(**init_args)
+        self._add_distribution(AirTemperature)
+        self._add_distribution(VaporPressure)
 
         if (
             self.config[Precipitation.DISTRIBUTION_KEY]["precip_rescaling_model"]
             == "winstral"
         ):
-            self.distribute[Wind.DISTRIBUTION_KEY] = Wind(**init_args)
+            self._add_distribution(Wind)
 
-        self.distribute[Precipitation.DISTRIBUTION_KEY] = Precipitation(
-            **init_args,
+        self._add_distribution(
+            Precipitation,
             start_date=self.start_date,
             time_step=self.config["time"]["time_step"],
         )
@@ -243,18 +270,16 @@ class SMRF:
         # Air temperature and vapor pressure
         # Always process air temperature and vapor pressure together since
         # they depend on each other
-        init_args=dict(config=self.config, topo=self.topo)
-
         if (
             AirTemperature.is_requested(self.output_variables) or
             VaporPressure.is_requested(self.output_variables)
         ):
-            self.distribute[AirTemperature.DISTRIBUTION_KEY] = AirTemperature(**init_args)
-            self.distribute[VaporPressure.DISTRIBUTION_KEY] = VaporPressure(**init_args)
+            self._add_distribution(AirTemperature)
+            self._add_distribution(VaporPressure)
 
         # Wind
         if Wind.is_requested(self.output_variables):
-            self.distribute[Wind.DISTRIBUTION_KEY] = Wind(**init_args)
+            self._add_distribution(Wind)
 
         # Precipitation
         if Precipitation.is_requested(self.output_variables):
@@ -262,34 +287,34 @@ class SMRF:
 
         # Cloud Factor
         if CloudFactor.is_requested(self.output_variables):
-            self.distribute[CloudFactor.DISTRIBUTION_KEY] = CloudFactor(**init_args)
+            self._add_distribution(CloudFactor)
 
         # Albedo
         if Albedo.is_requested(self.output_variables):
-            self.distribute[Albedo.DISTRIBUTION_KEY] = Albedo(**init_args)
+            self._add_distribution(Albedo)
 
         # Solar radiation; requires albedo and clouds
         if Solar.is_requested(self.output_variables):
             # Need clouds for solar, either use external one or add to distributed list
             if "hrrr_cloud" not in self.output_variables:
-                self.distribute[CloudFactor.DISTRIBUTION_KEY] = CloudFactor(**init_args)
+                self._add_distribution(CloudFactor)
 
             # Need precipitation for albedo (days since last storm)
             self.distribute_precip()
-            self.distribute[Albedo.DISTRIBUTION_KEY] = Albedo(**init_args)
+            self._add_distribution(Albedo)
 
-            self.distribute[Solar.DISTRIBUTION_KEY] = Solar(**init_args)
+            self._add_distribution(Solar)
         elif SolarHRRR.is_requested(self.output_variables):
             # Need precipitation for albedo (days since last storm)
             self.distribute_precip()
-            self.distribute[Albedo.DISTRIBUTION_KEY] = Albedo(**init_args)
+            self._add_distribution(Albedo)
 
             # Trigger loading all shortwave variables from HRRR
             self.config[GriddedInput.TYPE][InputGribHRRR.GDAL_VARIABLE_KEY] += (
                 SolarHRRR.GRIB_VARIABLES
             )
 
-            self.distribute[SolarHRRR.DISTRIBUTION_KEY] = SolarHRRR(**init_args)
+            self._add_distribution(SolarHRRR)
 
             # Add the required 'net_solar' output when requesting HRRR solar
             self.output_variables.add(SolarHRRR.DEFAULT_OUTPUT)
@@ -297,25 +322,25 @@ class SMRF:
         # Thermal radiation
         if Thermal.is_requested(self.output_variables):
             # Need air temperature and vapor pressure
-            self.distribute[AirTemperature.DISTRIBUTION_KEY] = AirTemperature(**init_args)
-            self.distribute[VaporPressure.DISTRIBUTION_KEY] = VaporPressure(**init_args)
+            self._add_distribution(AirTemperature)
+            self._add_distribution(VaporPressure)
 
             # Need clouds for solar, either use external one or add to distributed list
             if "hrrr_cloud" not in self.output_variables:
-                self.distribute[CloudFactor.DISTRIBUTION_KEY] = CloudFactor(**init_args)
+                self._add_distribution(CloudFactor)
             else:
                 self._logger.info("Using HRRR cloud file for thermal.")
 
-            self.distribute[Thermal.DISTRIBUTION_KEY] = Thermal(**init_args)
+            self._add_distribution(Thermal)
         elif ThermalHRRR.INI_VARIABLE in self.output_variables:
-            self.distribute[AirTemperature.DISTRIBUTION_KEY] = AirTemperature(**init_args)
+            self._add_distribution(AirTemperature)
 
             # Trigger loading of longwave from HRRR
             self.config[GriddedInput.TYPE][InputGribHRRR.GDAL_VARIABLE_KEY].append(
                 ThermalHRRR.GRIB_NAME
             )
 
-            self.distribute[ThermalHRRR.DISTRIBUTION_KEY] = ThermalHRRR(**init_args)
+            self._add_distribution(ThermalHRRR)
 
             # Also swap out the ini variable to treat running HRRR as the standard
             # 'thermal' variable
@@ -323,7 +348,7 @@ class SMRF:
             self.output_variables.add(Thermal.DISTRIBUTION_KEY)
 
         # Soil temperature
-        self.distribute[SoilTemperature.DISTRIBUTION_KEY] = SoilTemperature(**init_args)
+        self._add_distribution(SoilTemperature)
 
     def load_data(self):
         """
@@ -360,6 +385,11 @@ class SMRF:
             9. Thermal radiation
             10. Soil temperature
             11. Output time step if needed
+
+        Wind does not depend on the other variables and is distributed on a
+        background thread while air temperature and vapor pressure are.
+        The outputs of a time step are written on another background thread
+        while the next time step is distributed.
         """
         # Initialize method for each distribute module
         for v in self.distribute:
@@ -371,22 +401,40 @@ class SMRF:
                 self.distribute[v].initialize(self.data.metadata)
 
         # Distribute the data
-        for output_count, t in enumerate(self.date_time):
-            startTime = datetime.now()
-
-            self.distribute_single_timestep(t)
-            self.output(t)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=1
+            ) as self._executor, ThreadPoolExecutor(
+                max_workers=1
+            ) as self._output_executor:
+                for output_count, t in enumerate(self.date_time):
+                    startTime = datetime.now()
+
+                    self.distribute_single_timestep(t)
+                    self.output(t, output_count)
+
+                    telapsed = datetime.now() - startTime
+                    self._logger.debug(
+                        "{0:.2f} seconds for time step".format(
+                            telapsed.total_seconds()
+                        )
+                    )
 
-            telapsed = datetime.now() - startTime
-            self._logger.debug(
-                "{0:.2f} seconds for time step".format(telapsed.total_seconds())
-            )
+                self._wait_for_output()
+        finally:
+            self._executor = None
+            self._output_executor = None
+            self._output_future = None
 
         # Close all opened source files
         for v in self.distribute:
             if self.distribute[v].source_files is not None:
                 self.distribute[v].source_files.close()
 
+        if self._hrrr_cloud is not None:
+            self._hrrr_cloud[0].close()
+            self._hrrr_cloud = None
+
         self.forcing_data = 1
 
     def distribute_single_timestep(self, timestep: datetime) -> None:
@@ -400,6 +448,16 @@ class SMRF:
         if self.data.DATA_TYPE == InputGribHRRR.DATA_TYPE:
             self.data.load_timestep(timestep)
 
+        # Wind_speed and wind_direction
+        wind = None
+        if Wind.DISTRIBUTION_KEY in self.distribute:
+            wind = self._in_background(
+                self.distribute[Wind.DISTRIBUTION_KEY].distribute,
+                self.data.wind_speed.loc[timestep],
+                self.data.wind_direction.loc[timestep],
+                timestep,
+            )
+
         # Air temperature
         if AirTemperature.DISTRIBUTION_KEY in self.distribute:
             self.distribute[AirTemperature.DISTRIBUTION_KEY].distribute(
@@ -413,11 +471,9 @@ class SMRF:
                 self.distribute[AirTemperature.DISTRIBUTION_KEY].air_temp,
             )
 
-        # Wind_speed and wind_direction
-        if Wind.DISTRIBUTION_KEY in self.distribute:
-            self.distribute[Wind.DISTRIBUTION_KEY].distribute(
-                self.data.wind_speed.loc[timestep], self.data.wind_direction.loc[timestep], timestep
-            )
+        # Wait for wind, which also raises any error from distributing it
+        if wind is not None:
+            wind.result()
 
         # Precipitation
         if Precipitation.DISTRIBUTION_KEY in self.distribute:
@@ -460,23 +516,7 @@ class SMRF:
             cloud_factor = self.distribute[CloudFactor.DISTRIBUTION_KEY].cloud_factor
         elif "hrrr_cloud" in self.output_variables:
             try:
-                with netCDF4.Dataset(
-                    self.config["output"]["out_location"] + "/cloud_factor.nc"
-                ) as cloud_data:
-                    from cftime import num2date
-
-                    cloud_date_times = cloud_data["time"]
-                    cloud_dates = num2date(
-                        cloud_date_times[:],
-                        units=cloud_date_times.units,
-                        calendar=cloud_date_times.calendar,
-                        only_use_cftime_datetimes=False,
-                    )
-                    cloud_dates = [
-                        date.replace(tzinfo=self.time_zone).timestamp()
-                        for date in cloud_dates
-                    ]
-                    cloud_factor = cloud_data["TCDC"][cloud_dates.index(timestep.timestamp())]
+                cloud_factor = self.hrrr_cloud_factor(timestep)
             except FileNotFoundError:
                 self._logger.error(
                     "Thermal or Solar were requested as output, but either"
@@ -527,25 +567,77 @@ class SMRF:
                 )
 
         # Thermal radiation
-        if Thermal.DISTRIBUTION_KEY in self.distribute:
-            if isinstance(self.distribute[Thermal.DISTRIBUTION_KEY], Thermal):
-                self.distribute[Thermal.DISTRIBUTION_KEY].distribute(
-                    timestep,
-                    self.distribute[AirTemperature.DISTRIBUTION_KEY].air_temp,
-                    self.distribute[VaporPressure.DISTRIBUTION_KEY].vapor_pressure,
-                    self.distribute[VaporPressure.DISTRIBUTION_KEY].dew_point,
-                    cloud_factor,
-                )
-            elif isinstance(self.distribute[ThermalHRRR.DISTRIBUTION_KEY], ThermalHRRR):
-                self.distribute[ThermalHRRR.DISTRIBUTION_KEY].distribute(
-                    timestep,
-                    self.data.thermal,
-                    self.distribute[AirTemperature.DISTRIBUTION_KEY].air_temp,
-                )
+        # Thermal and ThermalHRRR share the distribution key, only one is enqueued
+        thermal = self.distribute.get(Thermal.DISTRIBUTION_KEY)
+        if isinstance(thermal, ThermalHRRR):
+            thermal.distribute(
+                timestep,
+                self.data.thermal,
+                self.distribute[AirTemperature.DISTRIBUTION_KEY].air_temp,
+            )
+        elif thermal is not None:
+            thermal.distribute(
+                timestep,
+                self.distribute[AirTemperature.DISTRIBUTION_KEY].air_temp,
+                self.distribute[VaporPressure.DISTRIBUTION_KEY].vapor_pressure,
+                self.distribute[VaporPressure.DISTRIBUTION_KEY].dew_point,
+                cloud_factor,
+            )
 
         # Soil temperature
         self.distribute[SoilTemperature.DISTRIBUTION_KEY].distribute()
 
+    def hrrr_cloud_factor(self, timestep: datetime):
+        """
+        Cloud factor for the time step from the cloud_factor.nc file in the output
+        folder. The file is opened and the time steps in it are indexed on the
+        first call and kept open until all time steps are distributed.
+
+        :param timestep: Time step to get the cloud factor for
+
+        :return: Cloud factor
+        """
+        with NETCDF_LOCK:
+            if self._hrrr_cloud is None:
+                cloud_data = netCDF4.Dataset(
+                    self.config["output"]["out_location"] + "/cloud_factor.nc"
+                )
+                from cftime import num2date
+
+                cloud_date_times = cloud_data["time"]
+                cloud_dates = num2date(
+                    cloud_date_times[:],
+                    units=cloud_date_times.units,
+                    calendar=cloud_date_times.calendar,
+                    only_use_cftime_datetimes=False,
+                )
+                cloud_index = {
+                    date.replace(tzinfo=self.time_zone).timestamp(): index
+                    for index, date in enumerate(cloud_dates)
+                }
+                self._hrrr_cloud = (cloud_data, cloud_index)
+
+            cloud_data, cloud_index = self._hrrr_cloud
+
+            return cloud_data["TCDC"][cloud_index[timestep.timestamp()]]
+
+    def _in_background(self, function, *args):
+        """
+        Call the function on the background thread when one is available.
+
+        Args:
+            function: Function to call
+            args: Arguments for the function
+
+        Returns:
+            Future of the call or None when the function was called directly
+        """
+        if self._executor is None:
+            function(*args)
+            return None
+
+        return self._executor.submit(function, *args)
+
     def initialize_output(self):
         """
         Initialize the output files based on the configFile section ['output'].
@@ -569,21 +661,44 @@ class SMRF:
         else:
             raise Exception("Could not determine type of file for output")
 
-    def output(self, current_time_step: datetime) -> None:
+    def output(self, current_time_step: datetime, output_count: int = None) -> None:
         """
         Output the forcing data or model outputs for the current_time_step.
 
         Args:
             current_time_step (date_time): The current time step
+            output_count (int): Position of the time step in the run, looked up
+                when not given
         """
-        output_count = self.date_time.index(current_time_step)
+        if output_count is None:
+            output_count = self.date_time.index(current_time_step)
 
         # Only output according to the user specified value,
         # or if it is the end.
         if (output_count % self.config["output"]["frequency"] == 0) or (
-            output_count == len(self.date_time)
+            output_count == len(self.date_time) - 1
         ):
-            self.output_writer.output(current_time_step)
+            if self._output_executor is None:
+                self.output_writer.output(current_time_step)
+                return
+
+            # Copy the data now, distributing the next time step reuses the grids
+            variable_data = self.output_writer.variable_data()
+
+            # Only one time step is written at a time, which also raises any error
+            # from writing the previous one
+            self._wait_for_output()
+            self._output_future = self._output_executor.submit(
+                self.output_writer.output, current_time_step, variable_data
+            )
+
+    def _wait_for_output(self) -> None:
+        """
+        Wait for the time step that is written on the background thread.
+        """
+        if self._output_future is not None:
+            self._output_future.result()
+            self._output_future = None
 
 
 def run_smrf(config, external_logger=None):
@@ -7,6 +7,7 @@ import netCDF4 as nc
 import numpy as np
 from smrf import __version__
 from smrf.data.load_topo import Topo
+from smrf.data.read_netcdf import NETCDF_LOCK
 from spatialnc.proj import add_proj, add_proj_from_file
 
 
@@ -46,6 +47,10 @@ class OutputNetcdf:
         self.out_frequency = int(out_config["frequency"])
         self.create_time = datetime.now().strftime(self.fmt)
 
+        # Written for variables without data at a time step, i.e. solar at night
+        self._zeros = np.zeros((self.topo.ny, self.topo.nx))
+        self._zeros.setflags(write=False)
+
         # Retrieve projection information from topo
         self.map_meta = add_proj_from_file(topo.file)
 
@@ -127,11 +132,13 @@ class OutputNetcdf:
             x_var = new_file.createVariable(
                 "x", "f", self.DIMENSIONS[2], **self.COMPRESSION
             )  # type: ignore
+            # One chunk per time step, which is the slab written by each output call
             variable = new_file.createVariable(
                 nc_variable,
                 self.out_config["netcdf_output_precision"],
                 self.DIMENSIONS,
                 least_significant_digit=4,
+                chunksizes=(1, self.topo_y.shape[0], self.topo_x.shape[0]),
                 **self.COMPRESSION,
             )  # type: ignore
 
@@ -172,16 +179,38 @@ class OutputNetcdf:
 
             new_file.setncattr_string("SMRF_version", __version__)
 
-    def output(self, date_time):
+    def variable_data(self) -> dict:
+        """
+        Copy of the current data for each output variable. The distribution classes
+        reuse their grids for the next time step, which requires a copy when the
+        time step is written later.
+
+        Returns:
+            Dictionary with the variable name (key) and data (value)
+        """
+        variable_data = {}
+
+        for nc_variable, module in self.output_variables.items():
+            data = getattr(module, nc_variable)
+            variable_data[nc_variable] = None if data is None else data.copy()
+
+        return variable_data
+
+    def output(self, date_time, variable_data: dict = None):
         """
         Output a time step
 
         Args:
             date_time: the date time object for the time step to be saved
+            variable_data: Data to write from :py:meth:`variable_data`, taken from
+                the distribution classes when not given
         """
         for nc_variable, module in self.output_variables.items():
             # Get the data from the distribution class
-            data = getattr(module, nc_variable)
+            if variable_data is None:
+                data = getattr(module, nc_variable)
+            else:
+                data = variable_data[nc_variable]
             self._logger.debug(
                 "{0} Writing variable {1} to from module {2} netCDF".format(
                     date_time, nc_variable, str(module)
@@ -189,9 +218,9 @@ class OutputNetcdf:
             )
 
             if data is None:
-                data = np.zeros((self.topo.ny, self.topo.nx))
+                data = self._zeros
 
-            with nc.Dataset(
+            with NETCDF_LOCK, nc.Dataset(
                 self.file_name(nc_variable), mode="a", format="NETCDF4"
             ) as file:
                 # the current time integer
@@ -84,6 +84,8 @@ class Grid:
 
             # now we have cell_id, cell_local and elevation for the whole grid
             self.full_df = df
+            # positions of the local cells in the station data
+            self.local_positions = metadata.index.get_indexer(df.cell_local)
 
             self.tri = None
 
@@ -108,7 +110,8 @@ class Grid:
         Interpolate using a detrended approach
 
         Args:
-            data: data to interpolate
+            data: numpy array of the data to interpolate, in the order of the
+                metadata
             grid_method: scipy.interpolate.griddata interpolation method
             constrain_trend: Bool - Constrain the trend within configured bounds
         """
@@ -132,13 +135,13 @@ class Grid:
         Interpolate using a detrended approach
 
         Args:
-            data: data to interpolate
+            data: data to interpolate, in the order of the metadata
             grid_method: scipy.interpolate.griddata interpolation method
             constrain_trend: Bool - Constrain the trend within configured bounds
         """
         # take the new full_df and fill a data column
         df = self.full_df.copy()
-        df["data"] = data[df["cell_local"]].values
+        df["data"] = data[self.local_positions]
 
         # Apply the custom function and aggregate the results
         df_fit_params = df.groupby("cell_id").apply(self.get_fit_params)
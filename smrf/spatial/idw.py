@@ -40,6 +40,8 @@ class InverseDistanceWeighted:
         # data information
         self.data = None
         self.nan_val = []
+        # sum of the weights when all stations have data
+        self._weights_sum = None
 
         # InverseDistanceWeighted parameters
         self.power = power
@@ -87,12 +89,42 @@ class InverseDistanceWeighted:
         data    - is the same size at mx,my
         """
         nan_val = ~np.isnan(data)
-        w = self.weights[:, :, nan_val]
-        data = data[nan_val]
 
-        v = np.nansum(w * data, 2) / np.sum(w, 2)
+        # weighted sum over the stations with data as one matrix product
+        v = self.stationWeights(nan_val) @ np.where(nan_val, data, 0)
 
-        return v
+        return v / self.weightsSum(nan_val)
+
+    def stationWeights(self, nan_val):
+        '''
+        Weights with the stations that are missing data set to 0. This also
+        excludes a station without data that is on a grid cell, where the
+        weight is infinite.
+
+        Args:
+            nan_val: boolean array that is True for stations with data
+        '''
+        if nan_val.all():
+            return self.weights
+
+        return np.where(nan_val, self.weights, 0)
+
+    def weightsSum(self, nan_val):
+        '''
+        Sum of the weights for the stations with data. Only the sum for all
+        stations is kept, the sum when stations are missing data is
+        calculated for each call.
+
+        Args:
+            nan_val: boolean array that is True for stations with data
+        '''
+        if not nan_val.all():
+            return np.sum(self.stationWeights(nan_val), 2)
+
+        if self._weights_sum is None:
+            self._weights_sum = np.sum(self.weights, 2)
+
+        return self._weights_sum
 
     def detrendedIDW(self, data, flag=0, zeros=None, local=False):
         """
@@ -62,6 +62,23 @@ class TestAlbedo(SMRFConfig, unittest.TestCase):
         self.assertEqual(TIMESTEP.strftime("%Y%m%d"), subject.start_date)
         self.assertEqual(TIMEZONE, subject.time_zone)
 
+    def test_load_veg_decay_date_method(self):
+        npt.assert_array_equal(
+            np.full((2, 2), 0.2, dtype=np.float32), self.subject.veg_max_decay
+        )
+        self.assertEqual(np.float32, self.subject.veg_max_decay.dtype)
+        self.assertIsNone(self.subject.litter_rate)
+
+    def test_load_veg_decay_hardy(self):
+        config = self._copy_config(CONFIG)
+        config["albedo"]["decay_method"] = "hardy2000"
+        config["albedo"]["hardy2000_litter_default"] = 0.003
+        subject = Albedo(config, TOPO_MOCK)
+        subject.initialize(DATA)
+
+        npt.assert_array_equal(np.full((2, 2), 0.003), subject.litter_rate)
+        self.assertIsNone(subject.veg_max_decay)
+
     def test_load_burn_mask_with_defined_mask(self):
         self.subject.topo.burn_mask = np.array([[1, 0], [0, 1]])
 
@@ -162,6 +179,49 @@ class TestAlbedo(SMRFConfig, unittest.TestCase):
         npt.assert_array_equal(self.subject.albedo_vis, date_albedo_vis)
         npt.assert_array_equal(self.subject.albedo_ir, date_albedo_ir)
 
+    def test_as_float32(self):
+        self.subject.albedo_vis = ALBEDO_VIS
+
+        result = self.subject.as_float32(Albedo.ALBEDO_VIS)
+
+        self.assertEqual(np.float32, result.dtype)
+        self.assertTrue(result.flags["C_CONTIGUOUS"])
+        npt.assert_equal(ALBEDO_VIS.astype(np.float32), result)
+        # Same array is only cast once
+        self.assertIs(result, self.subject.as_float32(Albedo.ALBEDO_VIS))
+
+    def test_as_float32_new_values(self):
+        self.subject.albedo_vis = ALBEDO_VIS
+        result = self.subject.as_float32(Albedo.ALBEDO_VIS)
+
+        self.subject.albedo_vis = ALBEDO_IR
+        updated = self.subject.as_float32(Albedo.ALBEDO_VIS)
+
+        self.assertIsNot(result, updated)
+        npt.assert_equal(ALBEDO_IR.astype(np.float32), updated)
+
+    def test_absorbed_from_vis_ir(self):
+        self.subject.albedo_vis = ALBEDO_VIS
+        self.subject.albedo_ir = ALBEDO_IR
+
+        result = self.subject.absorbed_from_vis_ir(np.float32(0.54), np.float32(0.46))
+
+        self.assertEqual(np.float32, result.dtype)
+        npt.assert_allclose(
+            1 - (0.54 * ALBEDO_VIS + 0.46 * ALBEDO_IR), result, rtol=1e-6
+        )
+        # Reused until the albedo changes
+        self.assertIs(
+            result,
+            self.subject.absorbed_from_vis_ir(np.float32(0.54), np.float32(0.46)),
+        )
+
+        self.subject.albedo_ir = ALBEDO_VIS
+        self.assertIsNot(
+            result,
+            self.subject.absorbed_from_vis_ir(np.float32(0.54), np.float32(0.46)),
+        )
+
     def test_before_decay_window(self):
         current, decay = self.subject.decay_window(NO_DECAY_TIME)
         self.assertEqual(-1, current)
@@ -203,7 +263,7 @@ class TestAlbedo(SMRFConfig, unittest.TestCase):
         )
 
         self.assertEqual(mock_decay_power.call_count, 1)
-        args, _ = mock_decay_power.call_args
+        args, kwargs = mock_decay_power.call_args
 
         npt.assert_array_equal(args[0], self.subject.veg)
         npt.assert_array_equal(args[1], TOPO_MOCK.veg_type)
@@ -212,6 +272,7 @@ class TestAlbedo(SMRFConfig, unittest.TestCase):
         npt.assert_array_equal(args[4], self.subject.config["date_method_decay_power"])
         npt.assert_array_equal(args[5], ALBEDO_VIS)
         npt.assert_array_equal(args[6], ALBEDO_IR)
+        self.assertIs(self.subject.veg_max_decay, kwargs["max_decay"])
 
         npt.assert_array_equal(res_v, expected_v)
         npt.assert_array_equal(res_ir, expected_ir)
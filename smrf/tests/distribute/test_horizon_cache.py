@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from smrf.distribute.horizon_cache import HorizonCache
+
+
+class TestHorizonCache(unittest.TestCase):
+    def setUp(self):
+        self.subject = HorizonCache(resolution=1.0)
+
+    def test_azimuth(self):
+        self.subject.resolution = 0.0
+        self.assertEqual(100.3, self.subject.azimuth(100.3))
+
+        self.subject.resolution = 0.5
+        self.assertEqual(100.5, self.subject.azimuth(100.3))
+        self.assertEqual(100.0, self.subject.azimuth(100.2))
+
+    def test_add(self):
+        horizon_angles = np.array([[1.0, 1.0]])
+
+        self.assertIsNone(self.subject.get(100))
+
+        self.subject.add(100, horizon_angles)
+        self.assertIs(horizon_angles, self.subject.get(100))
+
+    def test_add_none(self):
+        self.subject.add(100, None)
+
+        self.assertNotIn(100, self.subject)
+
+    def test_add_no_resolution(self):
+        self.subject = HorizonCache()
+        self.subject.add(100.3, np.array([[1.0, 1.0]]))
+
+        self.assertEqual(0, len(self.subject))
+        self.assertIsNone(self.subject.get(100.3))
+
+    def test_size(self):
+        for azimuth in range(HorizonCache.SIZE + 1):
+            self.subject.add(azimuth, np.array([azimuth]))
+
+        self.assertEqual(HorizonCache.SIZE, len(self.subject))
+        self.assertNotIn(0, self.subject)
+
+    def test_least_recently_used(self):
+        for azimuth in range(HorizonCache.SIZE):
+            self.subject.add(azimuth, np.array([azimuth]))
+
+        # Using the oldest grid again keeps it over the next oldest one
+        self.subject.add(0, self.subject.get(0))
+        self.subject.add(HorizonCache.SIZE, np.array([HorizonCache.SIZE]))
+
+        self.assertIn(0, self.subject)
+        self.assertNotIn(1, self.subject)
@@ -104,6 +104,41 @@ class TestSolar(unittest.TestCase):
         self.assertIsNone(self.subject.veg_ir_beam)
         self.assertIsNone(self.subject.veg_ir_diffuse)
 
+    @patch.object(Solar, "calc_stoporad")
+    def test_distribute_reuses_horizon_angles(self, toporad_mock):
+        toporad_mock.return_value = MOCK_SOLAR
+        self.subject.horizon_cache.resolution = 1.0
+
+        for _ in range(2):
+            self.subject.distribute(
+                DATETIME,
+                CLOUD_FACTOR,
+                ILLUMINATION_MOCK,
+                COS_Z,
+                AZIMUTH,
+                ALBEDO_MOCK,
+            )
+
+        self.assertIsNone(toporad_mock.call_args_list[0].args[6])
+        self.assertIs(MOCK_SOLAR[2], toporad_mock.call_args_list[2].args[6])
+
+    @patch.object(Solar, "calc_stoporad")
+    def test_distribute_default_keeps_no_horizon_angles(self, toporad_mock):
+        toporad_mock.return_value = MOCK_SOLAR
+
+        for _ in range(2):
+            self.subject.distribute(
+                DATETIME,
+                CLOUD_FACTOR,
+                ILLUMINATION_MOCK,
+                COS_Z,
+                AZIMUTH,
+                ALBEDO_MOCK,
+            )
+
+        self.assertIsNone(toporad_mock.call_args_list[2].args[6])
+        self.assertEqual(0, len(self.subject.horizon_cache))
+
     def test_distribute_sun_is_down(self):
         self.subject.distribute(
             DATETIME,
@@ -57,7 +57,9 @@ class TestSolarHRRR(unittest.TestCase):
             self.albedo,
         )
 
-        shade_mock.assert_called_once_with(COS_Z, AZIMUTH, ILLUMINATION_MOCK, TOPO_MOCK)
+        shade_mock.assert_called_once_with(
+            COS_Z, AZIMUTH, ILLUMINATION_MOCK, TOPO_MOCK, None
+        )
 
         ghi_vis = DATA_MOCK[SolarHRRR.VBDSF] * COS_Z + DATA_MOCK[SolarHRRR.VDDSF]
         npt.assert_equal(ghi_vis, self.subject.solar_ghi_vis)
@@ -71,15 +73,15 @@ class TestSolarHRRR(unittest.TestCase):
         dni = (DATA_MOCK[SolarHRRR.DSWRF] * (1 - k)) / COS_Z
         npt.assert_equal(dni, self.subject.solar_dni)
 
-        direct = dni * ILLUMINATION_MOCK
+        direct = (dni * ILLUMINATION_MOCK).astype(np.float32)
         npt.assert_equal(direct, self.subject.direct)
+        self.assertEqual(np.float32, self.subject.direct.dtype)
 
-        diffuse = dhi * SKY_VIEW_FACTOR_MOCK
+        diffuse = (dhi * SKY_VIEW_FACTOR_MOCK).astype(np.float32)
         npt.assert_equal(diffuse, self.subject.diffuse)
+        self.assertEqual(np.float32, self.subject.diffuse.dtype)
 
-        solar = direct.astype(np.float32, order="C", copy=False) + diffuse.astype(
-            np.float32, order="C", copy=False
-        )
+        solar = direct + diffuse
         npt.assert_equal(solar, self.subject.hrrr_solar)
 
         net_solar = solar * (
@@ -90,6 +92,32 @@ class TestSolarHRRR(unittest.TestCase):
         vegetation_mock.solar_veg_beam.assert_not_called()
         vegetation_mock.solar_veg_diffuse.assert_not_called()
 
+    @patch("smrf.distribute.solar_hrrr.mask_for_shade")
+    def test_distribute_reuses_horizon_angles(self, shade_mock):
+        horizon_angles = np.array([[1.0, 1.0]])
+        shade_mock.return_value = ILLUMINATION_MOCK, horizon_angles
+        self.subject.horizon_cache.resolution = 1.0
+
+        for _ in range(2):
+            self.subject.distribute(
+                DATETIME, DATA_MOCK, COS_Z, AZIMUTH, ILLUMINATION_MOCK, self.albedo
+            )
+
+        self.assertIsNone(shade_mock.call_args_list[0].args[4])
+        self.assertIs(horizon_angles, shade_mock.call_args_list[1].args[4])
+
+    @patch("smrf.distribute.solar_hrrr.mask_for_shade")
+    def test_distribute_default_keeps_no_horizon_angles(self, shade_mock):
+        shade_mock.return_value = ILLUMINATION_MOCK, np.array([[1.0, 1.0]])
+
+        for _ in range(2):
+            self.subject.distribute(
+                DATETIME, DATA_MOCK, COS_Z, AZIMUTH, ILLUMINATION_MOCK, self.albedo
+            )
+
+        self.assertIsNone(shade_mock.call_args_list[1].args[4])
+        self.assertEqual(0, len(self.subject.horizon_cache))
+
     @patch("smrf.distribute.solar_hrrr.vegetation")
     def test_distribute_with_vegetation(self, vegetation_mock):
         # Simulate the Toposplit call in distribute which sets the necessary attributes
@@ -107,7 +135,7 @@ class TestSolarHRRR(unittest.TestCase):
             self.subject.veg_k,
         )
         vegetation_mock.solar_veg_diffuse.assert_called_once_with(
-            diffuse, self.subject.veg_tau
+            diffuse, self.subject.veg_tau, out=diffuse
         )
 
     def test_distribute_sun_is_down(self):
@@ -128,6 +156,7 @@ class TestSolarHRRR(unittest.TestCase):
         npt.assert_equal(empty, self.subject.solar_dni)
         npt.assert_equal(empty, self.subject.hrrr_solar)
         npt.assert_equal(empty, self.subject.net_solar)
+        self.assertEqual(SolarHRRR.DTYPE, self.subject.net_solar.dtype)
 
     @patch("smrf.distribute.solar_hrrr.mask_for_shade")
     def test_below_threshold(self, shade_mock):
@@ -157,6 +186,27 @@ class TestSolarHRRR(unittest.TestCase):
         npt.assert_equal(empty, self.subject.hrrr_solar)
         npt.assert_equal(empty, self.subject.net_solar)
 
+    @patch("smrf.distribute.solar_hrrr.mask_for_shade")
+    def test_no_pixel_above_threshold(self, shade_mock):
+        self.subject.distribute(
+            DATETIME,
+            {
+                SolarHRRR.DSWRF: np.array([[0.5, 1.0]]),
+                SolarHRRR.VBDSF: np.array([[6.0, 8.0]]),
+                SolarHRRR.VDDSF: np.array([[5.0, 10.0]]),
+            },
+            COS_Z,
+            AZIMUTH,
+            ILLUMINATION_MOCK,
+            self.albedo,
+        )
+
+        shade_mock.assert_not_called()
+
+        empty = np.zeros_like(SKY_VIEW_FACTOR_MOCK)
+        npt.assert_equal(empty, self.subject.hrrr_solar)
+        npt.assert_equal(empty, self.subject.net_solar)
+
     def test_output_variables(self):
         for variable in self.subject.OUTPUT_VARIABLES.keys():
             self.assertTrue(
@@ -0,0 +1,104 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import numpy.testing as npt
+
+from smrf.distribute import Thermal
+from smrf.envphys.constants import STEF_BOLTZ
+from smrf.tests.distribute import TOPO_MOCK
+from smrf.tests.smrf_config import SMRFConfig
+
+AIR_TEMP_MOCK = np.array([[-2.0, 5.0], [1.0, 0.0]])
+VAPOR_PRESSURE_MOCK = np.array([[400.0, 600.0], [500.0, 550.0]])
+CLOUD_FACTOR_MOCK = np.array([[1.0, 0.5], [0.8, 0.2]])
+
+CONFIG = {
+    "time": {
+        "start_date": "2025-09-20 00:00",
+        "time_zone": "utc",
+    },
+    "thermal": {
+        "clear_sky_method": "dilley1998",
+        "correct_cloud": True,
+        "cloud_method": "garen2005",
+        "correct_veg": False,
+        "correct_terrain": False,
+    },
+}
+
+
+class TestThermal(unittest.TestCase, SMRFConfig):
+    def test_init_methods(self):
+        subject = Thermal(config=CONFIG, topo=TOPO_MOCK)
+
+        self.assertEqual(subject._clear_sky, subject._clear_sky_dilley1998)
+        self.assertEqual(subject._cloud_correction, subject._cloud_garen2005)
+
+    def test_init_unknown_method(self):
+        config = self._copy_config(CONFIG)
+        config["thermal"]["clear_sky_method"] = "unknown"
+
+        with self.assertRaises(KeyError):
+            Thermal(config=config, topo=TOPO_MOCK)
+
+    @patch("smrf.distribute.thermal.cloud")
+    @patch("smrf.distribute.thermal.clear_sky")
+    def test_distribute(self, clear_sky_mock, cloud_mock):
+        clear_sky_mock.Dilly1998.return_value = np.full((2, 2), 300.0)
+        cloud_mock.Garen2005.return_value = np.full((2, 2), 320.0)
+        subject = Thermal(config=CONFIG, topo=TOPO_MOCK)
+
+        subject.distribute(
+            "2025-09-20", AIR_TEMP_MOCK, VAPOR_PRESSURE_MOCK, None, CLOUD_FACTOR_MOCK
+        )
+
+        clear_sky_mock.Dilly1998.assert_called_once()
+        npt.assert_equal(
+            VAPOR_PRESSURE_MOCK / 1000, clear_sky_mock.Dilly1998.call_args[0][1]
+        )
+        cloud_mock.Garen2005.assert_called_once()
+        npt.assert_equal(np.full((2, 2), 300.0), subject.thermal_clear)
+        npt.assert_equal(np.full((2, 2), 320.0), subject.thermal_cloud)
+        npt.assert_equal(np.full((2, 2), 320.0), subject.thermal)
+        self.assertFalse(subject.thermal_clear.flags.writeable)
+        self.assertFalse(subject.thermal_cloud.flags.writeable)
+        self.assertTrue(subject.thermal.flags.writeable)
+
+    @patch("smrf.distribute.thermal.clear_sky")
+    def test_distribute_min_max(self, clear_sky_mock):
+        clear_sky = np.array([[100.0, 300.0], [np.nan, 700.0]])
+        clear_sky_mock.Dilly1998.return_value = clear_sky
+        config = self._copy_config(CONFIG)
+        config["thermal"]["correct_cloud"] = False
+        config["thermal"]["min"] = 200.0
+        config["thermal"]["max"] = 600.0
+        subject = Thermal(config=config, topo=TOPO_MOCK)
+
+        subject.distribute("2025-09-20", AIR_TEMP_MOCK, VAPOR_PRESSURE_MOCK)
+
+        npt.assert_equal(
+            np.array([[200.0, 300.0], [np.nan, 600.0]]), subject.thermal
+        )
+        npt.assert_equal(
+            np.array([[100.0, 300.0], [np.nan, 700.0]]), subject.thermal_clear
+        )
+
+    @patch("smrf.distribute.thermal.clear_sky")
+    def test_distribute_terrain(self, clear_sky_mock):
+        clear_sky = np.full((2, 2), 300.0)
+        clear_sky_mock.Dilly1998.return_value = clear_sky
+        sky_view_factor = np.array([[1.0, 0.8], [0.9, 0.5]])
+        config = self._copy_config(CONFIG)
+        config["thermal"]["correct_cloud"] = False
+        config["thermal"]["correct_terrain"] = True
+        subject = Thermal(config=config, topo=TOPO_MOCK)
+
+        with patch.object(Thermal, "sky_view_factor", new=sky_view_factor):
+            subject.distribute("2025-09-20", AIR_TEMP_MOCK, VAPOR_PRESSURE_MOCK)
+
+        npt.assert_allclose(
+            clear_sky * sky_view_factor
+            + (1.0 - sky_view_factor) * STEF_BOLTZ * AIR_TEMP_MOCK**4,
+            subject.thermal_clear,
+        )
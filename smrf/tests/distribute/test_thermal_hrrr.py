@@ -1,12 +1,13 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numexpr as ne
 import numpy as np
 import numpy.testing as npt
 import pandas as pd
 
 from smrf.distribute import ThermalHRRR
-from smrf.envphys.constants import EMISS_TERRAIN, FREEZE, STEF_BOLTZ
+from smrf.envphys.constants import EMISS_TERRAIN, EMISS_VEG, FREEZE, STEF_BOLTZ
 from smrf.tests.distribute import SKY_VIEW_FACTOR_MOCK, TOPO_MOCK
 from smrf.tests.smrf_config import SMRFConfig
 
@@ -27,6 +28,15 @@ CONFIG = {
 
 
 class TestThermalHRRR(unittest.TestCase, SMRFConfig):
+    def test_initialize(self):
+        self.subject = ThermalHRRR(config=CONFIG, topo=TOPO_MOCK)
+        self.subject.initialize(pd.DataFrame())
+
+        npt.assert_equal(
+            (1 - SKY_VIEW_FACTOR_MOCK) * EMISS_TERRAIN * STEF_BOLTZ,
+            self.subject._terrain_emission,
+        )
+
     def test_distribute(self):
         self.subject = ThermalHRRR(config=CONFIG, topo=TOPO_MOCK)
 
@@ -39,6 +49,51 @@ class TestThermalHRRR(unittest.TestCase, SMRFConfig):
 
         npt.assert_equal(result, self.subject.thermal)
 
+    def test_distribute_terrain(self):
+        sky_view_factor = np.array([[0.8, 0.5]])
+        self.subject = ThermalHRRR(config=CONFIG, topo=TOPO_MOCK)
+
+        result = (sky_view_factor * RAW_DATA_MOCK) + (
+            1 - sky_view_factor
+        ) * EMISS_TERRAIN * STEF_BOLTZ * (AIR_TEMP_MOCK + FREEZE) ** 4
+
+        with patch.object(ThermalHRRR, "sky_view_factor", new=sky_view_factor):
+            self.subject.initialize(pd.DataFrame())
+            self.subject.distribute("2025-09-20", RAW_DATA_MOCK, AIR_TEMP_MOCK)
+
+        npt.assert_allclose(result, self.subject.thermal)
+
+    def test_air_temp_kelvin_4(self):
+        self.subject = ThermalHRRR(config=CONFIG, topo=TOPO_MOCK)
+
+        result = self.subject.air_temp_kelvin_4(AIR_TEMP_MOCK)
+
+        npt.assert_allclose((AIR_TEMP_MOCK + FREEZE) ** 4, result)
+        self.assertIs(result, self.subject.air_temp_kelvin_4(AIR_TEMP_MOCK))
+
+        air_temp = AIR_TEMP_MOCK + 1
+        npt.assert_allclose(
+            (air_temp + FREEZE) ** 4, self.subject.air_temp_kelvin_4(air_temp)
+        )
+
+    def test_air_temp_kelvin_4_multiplications(self):
+        program = ne.disassemble(ThermalHRRR.AIR_TEMP_KELVIN_4)
+
+        self.assertFalse(any("pow" in str(operation[0]) for operation in program))
+
+    def test_distribute_updated_air_temp(self):
+        self.subject = ThermalHRRR(config=CONFIG, topo=TOPO_MOCK)
+        self.subject.initialize(pd.DataFrame())
+        air_temp = AIR_TEMP_MOCK.copy()
+
+        self.subject.distribute("2025-09-20", RAW_DATA_MOCK, air_temp)
+        air_temp += 5
+        self.subject.distribute("2025-09-20", RAW_DATA_MOCK, air_temp)
+
+        npt.assert_allclose(
+            (air_temp + FREEZE) ** 4, self.subject.air_temp_kelvin_4(air_temp)
+        )
+
     @patch("smrf.distribute.thermal_hrrr.vegetation")
     def test_distribute_vegetation(self, mock_vegetation):
         config = self._copy_config(CONFIG)
@@ -49,3 +104,25 @@ class TestThermalHRRR(unittest.TestCase, SMRFConfig):
         self.subject.distribute("2025-09-20=9", RAW_DATA_MOCK, AIR_TEMP_MOCK)
 
         mock_vegetation.thermal_correct_canopy.assert_called_once()
+
+    def test_distribute_vegetation_in_place(self):
+        config = self._copy_config(CONFIG)
+        config["thermal"]["correct_veg"] = True
+        self.subject = ThermalHRRR(config=config, topo=TOPO_MOCK)
+
+        thermal = (SKY_VIEW_FACTOR_MOCK * RAW_DATA_MOCK) + (
+            1 - SKY_VIEW_FACTOR_MOCK
+        ) * EMISS_TERRAIN * STEF_BOLTZ * (AIR_TEMP_MOCK + FREEZE) ** 4
+        tau = TOPO_MOCK.veg_tau
+        result = tau * thermal + (1 - tau) * (
+            STEF_BOLTZ * EMISS_VEG * (AIR_TEMP_MOCK + FREEZE) ** 4
+        )
+
+        self.subject.initialize(pd.DataFrame())
+        self.subject.distribute("2025-09-20", RAW_DATA_MOCK, AIR_TEMP_MOCK)
+
+        npt.assert_allclose(result, self.subject.thermal)
+        self.assertIs(
+            self.subject._scratch_buffers[ThermalHRRR.DISTRIBUTION_KEY],
+            self.subject.thermal,
+        )
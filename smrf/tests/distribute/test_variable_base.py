@@ -139,6 +139,50 @@ class TestVariableBase(SMRFConfig, unittest.TestCase):
         npt.assert_equal(TOPO.mask, kwargs["mask"])
         pdt.assert_frame_equal(station_subset, kwargs["metadata"])
 
+    def test_initialize_interpolate(self):
+        self.subject.initialize(METADATA)
+
+        self.assertEqual(self.subject._interpolate_grid, self.subject._interpolate)
+
+    def test_distribute(self):
+        distributed = np.array([[1.0, 2.0], [3.0, 4.0]])
+        self.grid.return_value.detrended_interpolation.return_value = distributed
+        data = pd.Series([1.0, 2.0], index=STATIONS)
+
+        self.subject.initialize(METADATA)
+        self.subject._distribute(data)
+
+        (args, _kwargs) = self.grid.return_value.detrended_interpolation.call_args
+        npt.assert_equal(np.array([2.0]), args[0])
+        self.assertIs(distributed, self.subject.test_variable)
+
+    def test_station_positions(self):
+        index = pd.Index(["station 3", "station 2", "station 1"])
+
+        positions = self.subject._station_positions(index)
+
+        npt.assert_equal([1], positions)
+        self.assertIs(positions, self.subject._station_positions(index))
+        npt.assert_equal(
+            [0], self.subject._station_positions(pd.Index(["station 2"]))
+        )
+
+    def test_distribute_missing_station(self):
+        data = pd.Series([1.0, 2.0], index=["station 1", "station 3"])
+
+        self.subject.initialize(METADATA)
+
+        with self.assertRaises(KeyError):
+            self.subject._distribute(data)
+
+    def test_distribute_all_nan(self):
+        data = pd.Series([1.0, np.nan], index=STATIONS)
+
+        self.subject.initialize(METADATA)
+
+        with self.assertRaises(Exception):
+            self.subject._distribute(data)
+
     @patch("smrf.distribute.variable_base.VariableBase._initialize")
     @patch("smrf.distribute.variable_base.VariableBase._open_source_files")
     def test_initialzie_with_source_files(self, mock_open_source_files, _mock_initialzie):
@@ -182,3 +226,21 @@ class TestVariableBase(SMRFConfig, unittest.TestCase):
         npt.assert_equal(self.subject.veg_tau, TOPO.veg_tau)
         npt.assert_equal(self.subject.veg_k, TOPO.veg_k)
         npt.assert_equal(self.subject.veg_type, TOPO.veg_type)
+
+    def test_scratch(self):
+        buffer = self.subject._scratch("test", TOPO.dem, np.float32)
+
+        self.assertEqual(TOPO.dem.shape, buffer.shape)
+        self.assertEqual(np.float32, buffer.dtype)
+        self.assertTrue(buffer.flags.writeable)
+
+        buffer.setflags(write=False)
+        reused = self.subject._scratch("test", TOPO.dem, np.float32)
+        self.assertIs(buffer, reused)
+        self.assertTrue(reused.flags.writeable)
+
+    def test_scratch_changed_dtype(self):
+        buffer = self.subject._scratch("test", TOPO.dem, np.float32)
+
+        self.assertIsNot(buffer, self.subject._scratch("test", TOPO.dem))
+        self.assertIsNot(buffer, self.subject._scratch("other", TOPO.dem, np.float32))
@@ -1,3 +1,9 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import netCDF4 as nc
 import numpy as np
 import pandas as pd
@@ -5,6 +11,7 @@ import pytz
 
 from smrf.data import Topo
 from smrf.distribute.wind.wind import Wind
+from smrf.distribute.wind.wind_ninja import WindNinjaModel
 from smrf.tests.smrf_test_case_lakes import SMRFTestCaseLakes
 from smrf.utils import utils
 from smrf.utils.utils import date_range
@@ -81,3 +88,183 @@ class TestWindNinja(SMRFTestCaseLakes):
         self.assertTrue(np.all(np.diff(wn.windninja_x) > 0))
         self.assertTrue(np.all(np.diff(wn.windninja_y) < 0))
         self.assertTrue(np.sum(np.isnan(g_vel)) == 0)
+
+
+class TestWindNinjaWeights(unittest.TestCase):
+    XY = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+    UV = np.array([[0.25, 0.25]])
+    VTX = np.array([[0, 1, 2]])
+    WTS = np.array([[0.5, 0.25, 0.25]])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.weights_file = str(Path(self.tmp_dir.name, "weights"))
+        self.config = {
+            "wind_ninja_dir": self.tmp_dir.name,
+            "wind_ninja_dxdy": 100,
+            "wind_ninja_pref": "test",
+            "wind_ninja_tz": None,
+            "wind_ninja_weights": self.weights_file,
+        }
+        self.subject = WindNinjaModel(MagicMock(config=self.config))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch("smrf.distribute.wind.wind_ninja.utils.interp_weights")
+    def test_interp_weights_no_file(self, mock_weights):
+        self.config["wind_ninja_weights"] = None
+        mock_weights.return_value = (self.VTX, self.WTS)
+
+        self.subject.interp_weights(self.XY, self.UV)
+
+        mock_weights.assert_called_once()
+        self.assertFalse(Path(self.weights_file).exists())
+
+    @patch("smrf.distribute.wind.wind_ninja.utils.interp_weights")
+    def test_interp_weights_file(self, mock_weights):
+        mock_weights.return_value = (self.VTX, self.WTS)
+
+        self.subject.interp_weights(self.XY, self.UV)
+        vtx, wts = self.subject.interp_weights(self.XY, self.UV)
+
+        mock_weights.assert_called_once()
+        self.assertTrue(Path(self.weights_file).exists())
+        np.testing.assert_equal(self.VTX, vtx)
+        np.testing.assert_equal(self.WTS, wts)
+
+    @patch("smrf.distribute.wind.wind_ninja.utils.interp_weights")
+    def test_interp_weights_file_other_grid(self, mock_weights):
+        mock_weights.return_value = (self.VTX, self.WTS)
+
+        self.subject.interp_weights(self.XY, self.UV)
+        self.subject.interp_weights(self.XY, self.UV + 0.25)
+
+        self.assertEqual(2, mock_weights.call_count)
+
+
+class TestWindNinjaPath(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.subject = WindNinjaModel(
+            MagicMock(
+                config={
+                    "wind_ninja_dir": self.tmp_dir.name,
+                    "wind_ninja_dxdy": 100,
+                    "wind_ninja_pref": "test",
+                    "wind_ninja_tz": "UTC",
+                }
+            )
+        )
+        self.date_time = pd.Timestamp("2025-01-02 03:00", tz="UTC")
+        self.data_dir = Path(self.tmp_dir.name, "data20250102", "wind_ninja_data")
+        self.data_dir.mkdir(parents=True)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_wind_ninja_path(self):
+        vel_file = self.data_dir.joinpath("test_01-02-2025_0300_100m_vel.asc")
+        vel_file.touch()
+
+        self.assertEqual(
+            str(vel_file), self.subject.wind_ninja_path(self.date_time, "vel")
+        )
+        with self.assertRaises(ValueError):
+            self.subject.wind_ninja_path(self.date_time, "ang")
+
+    def test_wind_ninja_files_listed_once(self):
+        self.data_dir.joinpath("test_01-02-2025_0300_100m_vel.asc").touch()
+
+        with patch(
+            "smrf.distribute.wind.wind_ninja.os.scandir", wraps=os.scandir
+        ) as mock_scandir:
+            self.subject.wind_ninja_path(self.date_time, "vel")
+            self.subject.wind_ninja_path(self.date_time, "vel")
+
+        mock_scandir.assert_called_once_with(str(self.data_dir))
+
+
+class TestWindNinjaConvert(unittest.TestCase):
+    # The second grid cell is outside of the WindNinja grid
+    VTX = np.array([[0, 1, 2], [0, 1, 2]])
+    WTS = np.array([[0.5, 0.25, 0.25], [-0.5, 1.0, 0.5]])
+    DATA = np.array([[0.0, 90.0, 90.0]])
+
+    def setUp(self):
+        wind_distribution = MagicMock(
+            config={
+                "wind_ninja_dir": None,
+                "wind_ninja_dxdy": 100,
+                "wind_ninja_pref": "test",
+                "wind_ninja_tz": None,
+            }
+        )
+        wind_distribution._scratch.side_effect = (
+            lambda name, like, dtype=None: np.empty(like.shape, dtype=dtype)
+        )
+        self.subject = WindNinjaModel(wind_distribution)
+        self.subject.X = np.zeros((1, 2))
+        self.subject.vtx = self.VTX
+        self.subject.wts = self.WTS
+        self.subject.model_dxdy = 100
+        self.subject.ln_wind_scale = 1.0
+
+    @patch.object(WindNinjaModel, "fill_data", side_effect=lambda grid: grid)
+    @patch.object(WindNinjaModel, "wind_ninja_path")
+    @patch("smrf.distribute.wind.wind_ninja.utils.read_asc_data")
+    def test_convert_wind_ninja_outside(self, read_mock, _path_mock, fill_mock):
+        read_mock.return_value = self.DATA
+
+        self.subject.convert_wind_ninja(pd.Timestamp("2025-01-02 03:00"))
+
+        u, v = (call.args[0] for call in fill_mock.call_args_list)
+        np.testing.assert_allclose(0.5, u[0, 0])
+        np.testing.assert_allclose(0.5, v[0, 0])
+        self.assertTrue(np.isnan(u[0, 1]))
+        self.assertTrue(np.isnan(v[0, 1]))
+
+
+class TestWindNinjaFillNan(unittest.TestCase):
+    DATA = np.array(
+        [
+            [np.nan, 1.0, np.nan, 3.0, np.nan],
+            [np.nan, np.nan, 2.0, 4.0, 5.0],
+            [np.nan, np.nan, np.nan, np.nan, np.nan],
+            [np.nan, np.nan, 7.0, np.nan, np.nan],
+        ]
+    )
+
+    def test_fill_nan_rows(self):
+        x = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+
+        result = WindNinjaModel.fill_nan(self.DATA, x, axis=1)
+
+        np.testing.assert_allclose(
+            np.array(
+                [
+                    [0.0, 1.0, 2.0, 3.0, 4.0],
+                    [-2.0, 0.0, 2.0, 4.0, 5.0],
+                    self.DATA[2],
+                    self.DATA[3],
+                ]
+            ),
+            result,
+        )
+
+    def test_fill_nan_descending(self):
+        x = np.array([40.0, 30.0, 20.0, 10.0])
+
+        result = WindNinjaModel.fill_nan(self.DATA[:, 1:], x, axis=0)
+
+        np.testing.assert_allclose(
+            np.array(
+                [
+                    [1.0, -0.5, 3.0, np.nan],
+                    [np.nan, 2.0, 4.0, 5.0],
+                    [np.nan, 4.5, 5.0, np.nan],
+                    [np.nan, 7.0, 6.0, np.nan],
+                ]
+            ),
+            result,
+        )
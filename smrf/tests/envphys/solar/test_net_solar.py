@@ -39,6 +39,15 @@ class TestNetSolar(unittest.TestCase):
         expected = SOLAR_1 * (1 - ALBEDO_1)
         npt.assert_equal(expected, result)
 
+    def test_broadband_albedo_out(self):
+        self.albedo.albedo = ALBEDO_1
+        out = np.empty_like(SOLAR_1)
+
+        result = NetSolar.broadband_albedo(SOLAR_1, self.albedo, out=out)
+
+        self.assertIs(out, result)
+        npt.assert_equal(SOLAR_1 * (1 - ALBEDO_1), result)
+
     def test_broadband_from_vis_ir(self):
         self.albedo.albedo_vis = ALBEDO_1
         self.albedo.albedo_ir = ALBEDO_2
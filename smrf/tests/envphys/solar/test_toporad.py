@@ -78,6 +78,12 @@ class TestToporad(SMRFTestCaseLakes):
         npt.assert_allclose(71, np.min(rad.diffuse), atol=1)
         npt.assert_allclose(79, np.max(rad.diffuse), atol=1)
 
+    def test_elevrad_domain_pressure(self):
+        pressure = toporad.Elevrad.domain_pressure(self.dem)
+
+        self.assertIs(pressure, toporad.Elevrad.domain_pressure(self.dem))
+        self.assertIsNot(pressure, toporad.Elevrad.domain_pressure(self.dem.copy()))
+
     def test_toporad(self):
         trad_beam, trad_diffuse = toporad.toporad(
             self.elevrad.beam,
@@ -170,3 +176,34 @@ class TestToporad(SMRFTestCaseLakes):
         npt.assert_equal(zero_array, beam)
         npt.assert_equal(zero_array, diffuse)
         npt.assert_equal(zero_array, horizon_angles)
+
+    def test_mask_for_shade(self):
+        horizon_angles = np.array([[0.0, np.radians(50)], [np.radians(-50), 0.1]])
+        illumination_angles = np.full((2, 2), 0.5)
+
+        shaded_angles, horizon = toporad.mask_for_shade(
+            np.cos(np.radians(45)),
+            self.azimuth,
+            illumination_angles,
+            self.topo,
+            horizon_angles,
+        )
+
+        self.assertIs(horizon_angles, horizon)
+        npt.assert_equal(shaded_angles, [[0.5, 0.0], [0.0, 0.5]])
+        npt.assert_equal(illumination_angles, np.full((2, 2), 0.5))
+
+    def test_stoporad_no_illumination(self):
+        beam, diffuse, horizon_angles = toporad.stoporad(
+            self.date_time,
+            self.topo,
+            self.cosz,
+            self.azimuth,
+            np.zeros_like(self.dem),
+            np.ones_like(self.dem),
+            wavelength_range=[0.7, 2.8],
+        )
+
+        self.assertIsNone(horizon_angles)
+        npt.assert_equal(beam, diffuse)
+        self.assertTrue(np.all(diffuse > 0))
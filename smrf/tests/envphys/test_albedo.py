@@ -3,7 +3,14 @@ import unittest
 import numpy as np
 import numpy.testing as npt
 
-from smrf.envphys.albedo import decay_alb_power, decay_burned
+from smrf.envphys.albedo import (
+    albedo,
+    decay_alb_hardy,
+    decay_alb_power,
+    decay_burned,
+    growth,
+    veg_type_values,
+)
 
 ALBEDO_VIS = np.array([[0.8, 0.6], [0.7, 0.5]])
 ALBEDO_IR = np.array([[0.7, 0.5], [0.6, 0.4]])
@@ -12,6 +19,66 @@ BURNED_NO_SNOWFALL = np.array([[0.0, 0.0], [0.0, 0.0]])
 K_BURNED = 0.06
 
 
+class TestAlbedo(unittest.TestCase):
+    def test_albedo_sun_up(self):
+        storm_day = np.array([[0.0, 1.0], [2.5, 10.0]])
+        cos_z = np.array([[0.5, 1.0], [0.0, -0.2]])
+
+        alb_v, alb_ir = albedo(storm_day, cos_z, 100, 700, 2)
+
+        # Without the sun the albedo is the value for cos(z) = 1
+        alb_v_1, alb_ir_1 = albedo(storm_day, np.ones_like(cos_z), 100, 700, 2)
+        npt.assert_array_equal(alb_v_1[1], alb_v[1])
+        npt.assert_array_equal(alb_ir_1[1], alb_ir[1])
+        npt.assert_array_equal(alb_v_1[:, 1], alb_v[:, 1])
+        npt.assert_array_equal(alb_ir_1[:, 1], alb_ir[:, 1])
+        # Increase for a lower sun
+        self.assertGreater(alb_v[0, 0], alb_v_1[0, 0])
+        self.assertGreater(alb_ir[0, 0], alb_ir_1[0, 0])
+
+
+class TestGrowth(unittest.TestCase):
+    def test_growth(self):
+        t = np.array([1.0, 2.0, 11.5])
+
+        npt.assert_allclose(
+            1.0 - ((4.0 + 3.0 * t + t * t) / (2.0 + t + t * t) - 1.0), growth(t)
+        )
+        npt.assert_allclose(t * (t - 1.0) / (2.0 + t + t * t), growth(t))
+
+
+class TestVegTypeValues(unittest.TestCase):
+    def test_veg_type_values(self):
+        values = {"default": 0.2, "41": 0.25, "42": 0.3, "99": 0.5}
+        veg_type = np.array([[0, 41], [42, 43]])
+
+        npt.assert_equal(
+            np.array([[0.2, 0.25], [0.3, 0.2]]),
+            veg_type_values(values, veg_type),
+        )
+
+    def test_veg_type_values_negative(self):
+        values = {"default": 0.2, "41": 0.25}
+        veg_type = np.array([[-9999, 41]])
+
+        result = veg_type_values(values, veg_type, np.float32)
+
+        self.assertEqual(np.float32, result.dtype)
+        npt.assert_equal(np.array([[0.2, 0.25]], dtype=np.float32), result)
+
+    def test_veg_type_values_masked(self):
+        values = {"default": 0.2, "41": 0.25}
+        veg_type = np.ma.masked_array(
+            np.array([[-2147483647, 41], [42, 41]]),
+            mask=[[True, False], [False, False]],
+        )
+
+        npt.assert_equal(
+            np.array([[0.2, 0.25], [0.2, 0.25]]),
+            veg_type_values(values, veg_type),
+        )
+
+
 class TestDecayAlbPower(unittest.TestCase):
     def setUp(self):
         self.veg = {
@@ -125,6 +192,24 @@ class TestDecayAlbPower(unittest.TestCase):
         npt.assert_array_almost_equal(expected_ir, alb_ir_d, decimal=5)
 
 
+class TestDecayAlbHardy(unittest.TestCase):
+    def test_decay_alb_hardy(self):
+        litter = {"default": 0.003, "albedo": 0.2, "41": 0.006, "42": 0.006}
+        veg_type = np.array([[0, 41], [42, 0]])
+        l_rate = np.array([[0.003, 0.006], [0.006, 0.003]])
+
+        sc = (1.0 - l_rate) ** LAST_SNOW
+        expected_v = ALBEDO_VIS * sc + 0.2 * (1.0 - sc)
+        expected_ir = ALBEDO_IR * sc + 0.2 * (1.0 - sc)
+
+        alb_v_d, alb_ir_d = decay_alb_hardy(
+            litter, veg_type, LAST_SNOW, ALBEDO_VIS, ALBEDO_IR
+        )
+
+        npt.assert_allclose(expected_v, alb_v_d)
+        npt.assert_allclose(expected_ir, alb_ir_d)
+
+
 class TestDecayBurned(unittest.TestCase):
     """
     NOTE: All arrays passed in as arguments are updated in place, so pass a `copy()`
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from smrf.envphys.core import envphys_c
+
+# Vapor pressure in Pa, the dew point of the last two pixels is above the
+# air temperature and is limited to ta - 0.2
+VAPOR_PRESSURE = np.array([[400.0, 800.0], [600.0, 2000.0]])
+AIR_TEMP = np.array([[0.0, 5.0], [-2.0, 10.0]])
+ELEVATION = np.array([[0.0, 1500.0], [2000.0, 2500.0]])
+TOLERANCE = 0.01
+
+
+class TestDewPointWetBulb(unittest.TestCase):
+    def test_cdewpt_wbt(self):
+        dew_point = np.empty_like(VAPOR_PRESSURE)
+        envphys_c.cdewpt(VAPOR_PRESSURE, dew_point, TOLERANCE)
+        clamped = dew_point >= AIR_TEMP
+        dew_point[clamped] = AIR_TEMP[clamped] - 0.2
+        wet_bulb = np.empty_like(VAPOR_PRESSURE)
+        envphys_c.cwbt(AIR_TEMP, dew_point, ELEVATION, wet_bulb, TOLERANCE)
+
+        result_dew_point = np.empty_like(VAPOR_PRESSURE)
+        result_wet_bulb = np.empty_like(VAPOR_PRESSURE)
+        envphys_c.cdewpt_wbt(
+            VAPOR_PRESSURE,
+            AIR_TEMP,
+            ELEVATION,
+            result_dew_point,
+            result_wet_bulb,
+            TOLERANCE,
+        )
+
+        npt.assert_equal(np.array([[False, False], [True, True]]), clamped)
+        npt.assert_allclose(dew_point, result_dew_point)
+        npt.assert_allclose(wet_bulb, result_wet_bulb)
+
+    def test_cdewpt_wbt_below_zero_kelvin(self):
+        air_temp = AIR_TEMP.copy()
+        air_temp[0, 0] = -300.0
+
+        with self.assertRaises(ValueError):
+            envphys_c.cdewpt_wbt(
+                VAPOR_PRESSURE,
+                air_temp,
+                ELEVATION,
+                np.empty_like(VAPOR_PRESSURE),
+                np.empty_like(VAPOR_PRESSURE),
+                TOLERANCE,
+            )
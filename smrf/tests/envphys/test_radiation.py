@@ -106,6 +106,17 @@ class TestRadiation(SMRFTestCase):
         spy = irradiance.direct_solar_irradiance(date_time, w=[0.58, 0.68])
         self.assertTrue(np.abs(spy - sin) <= 0.021)
 
+    def test_solint_cached(self):
+        irradiance.solint.cache_clear()
+
+        irradiance.solint(0.28, 2.8)
+        irradiance.solint(0.28, 2.8)
+        irradiance.solint(0.58, 0.68)
+
+        info = irradiance.solint.cache_info()
+        self.assertEqual(1, info.hits)
+        self.assertEqual(2, info.misses)
+
     def test_twostream(self):
         """ Twostream calculation """
 
@@ -1,5 +1,6 @@
 import unittest
 import numpy as np
+import pandas as pd
 
 from smrf.envphys import storms
 
@@ -142,6 +143,86 @@ class TestTimeSinceStormContinued(unittest.TestCase):
         )
 
 
+class TestTimeSinceStormPixel(unittest.TestCase):
+    PRECIP = np.array([[0.0, 0.5], [1.0, 2.0]])
+    PERCENT_SNOW = np.array([[1.0, 1.0], [1.0, 0.2]])
+
+    def test_storm_reset(self):
+        storm_days = storms.time_since_storm_pixel(
+            self.PRECIP, np.zeros(TOPO), self.PERCENT_SNOW, True,
+            time_step=0.5, stormDays=np.ones(TOPO)
+        )
+
+        np.testing.assert_equal(storm_days, [[1.5, 1.5], [0.0, 1.5]])
+
+    def test_warm_storm(self):
+        storm_days = storms.time_since_storm_pixel(
+            self.PRECIP, np.full(TOPO, 2.0), self.PERCENT_SNOW, True,
+            time_step=0.5, stormDays=np.ones(TOPO)
+        )
+
+        np.testing.assert_equal(storm_days, np.full(TOPO, 1.5))
+
+    def test_not_storming(self):
+        storm_days = storms.time_since_storm_pixel(
+            self.PRECIP, np.zeros(TOPO), self.PERCENT_SNOW, False,
+            time_step=0.5
+        )
+
+        np.testing.assert_equal(storm_days, np.full(TOPO, 0.5))
+
+
+class TestTrackingByStation(unittest.TestCase):
+    def test_storms(self):
+        precip = pd.DataFrame(
+            {
+                'station_1': [0.0, 1.0, 0.5, 0.0, 0.0, 0.0, 0.0, 2.0],
+                'station_2': [0.0, 0.0, 1.5, 0.0, 0.0, 0.0, 0.0, 0.0],
+            },
+            index=pd.date_range('2025-01-01', periods=8, freq='h'),
+        )
+
+        storm_list, storm_count = storms.tracking_by_station(
+            precip, mass_thresh=0.1, steps_thresh=2
+        )
+
+        self.assertEqual(2, storm_count)
+        self.assertEqual(
+            ['start', 'end', 'station_1', 'station_2'], list(storm_list)
+        )
+        self.assertEqual(
+            [precip.index[1], precip.index[7]], list(storm_list['start'])
+        )
+        self.assertEqual(
+            [precip.index[4], precip.index[7]], list(storm_list['end'])
+        )
+        np.testing.assert_equal([1.5, 2.0], storm_list['station_1'])
+        np.testing.assert_equal([1.5, 0.0], storm_list['station_2'])
+
+
+class TestClipAndCorrect(unittest.TestCase):
+    def test_clip_and_correct(self):
+        precip = pd.DataFrame(
+            {
+                'station_1': [1.0, 1.0, 1.0, 1.0],
+                'station_2': [0.0, 2.0, 0.0, 0.0],
+            },
+            index=pd.date_range('2025-01-01', periods=4, freq='h'),
+        )
+        storm_list = pd.DataFrame(
+            {'start': [precip.index[1]], 'end': [precip.index[2]]}
+        )
+
+        corrected = storms.clip_and_correct(precip, storm_list)
+
+        np.testing.assert_equal(
+            corrected['station_1'].to_numpy(), [0.0, 2.0, 2.0, 0.0]
+        )
+        np.testing.assert_equal(
+            corrected['station_2'].to_numpy(), [0.0, 2.0, 0.0, 0.0]
+        )
+
+
 def run_storm_days(
     storm_days_expected,
     storm_precip_expected,
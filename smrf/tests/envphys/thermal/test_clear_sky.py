@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from smrf.envphys.constants import FREEZE, STEF_BOLTZ
+from smrf.envphys.thermal import clear_sky
+
+AIR_TEMP = np.array([[-5.0, 0.0], [2.5, 10.0]])
+VAPOR_PRESSURE = np.array([[0.4, 0.6], [0.7, 0.9]])
+
+
+class TestClearSky(unittest.TestCase):
+    def test_dilly_1998(self):
+        ta = AIR_TEMP + FREEZE
+        w = 4650 * VAPOR_PRESSURE / ta
+
+        npt.assert_allclose(
+            59.38 + 113.7 * (ta / 273.16) ** 6 + 96.96 * np.sqrt(w / 25),
+            clear_sky.Dilly1998(AIR_TEMP, VAPOR_PRESSURE),
+        )
+
+    def test_prata_1996(self):
+        ta = AIR_TEMP + FREEZE
+        w = 4650 * VAPOR_PRESSURE / ta
+        ec = 1 - (1 + w) * np.exp(-np.sqrt(1.2 + 3 * w))
+
+        npt.assert_allclose(
+            ec * STEF_BOLTZ * ta**4,
+            clear_sky.Prata1996(AIR_TEMP, VAPOR_PRESSURE),
+        )
+
+    def test_angstrom_1918(self):
+        ta = AIR_TEMP + FREEZE
+        e = 0.83 - 0.18 * np.power(10, -0.67 * VAPOR_PRESSURE)
+
+        npt.assert_allclose(
+            e * STEF_BOLTZ * ta**4,
+            clear_sky.Angstrom1918(AIR_TEMP, VAPOR_PRESSURE),
+        )
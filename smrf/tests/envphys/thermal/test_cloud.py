@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from smrf.envphys.constants import FREEZE, STEF_BOLTZ
+from smrf.envphys.thermal import cloud
+
+THERMAL = np.array([[250.0, 280.0], [300.0, 320.0]])
+AIR_TEMP = np.array([[-5.0, 0.0], [2.5, 10.0]])
+VAPOR_PRESSURE = np.array([[0.4, 0.6], [0.7, 0.9]])
+CLOUD_FACTOR = np.array([[1.0, 0.8], [0.5, 0.2]])
+
+
+class TestCloud(unittest.TestCase):
+    def test_garen_2005(self):
+        npt.assert_allclose(
+            THERMAL * (1.485 - 0.488 * CLOUD_FACTOR),
+            cloud.Garen2005(THERMAL, CLOUD_FACTOR),
+        )
+
+    def test_unsworth_1975(self):
+        c = 1 - CLOUD_FACTOR
+        ta = AIR_TEMP + FREEZE
+        ec = THERMAL / (STEF_BOLTZ * ta**4)
+        ea = (1 - 0.84 * c) * ec + 0.84 * c
+
+        npt.assert_allclose(
+            ea * STEF_BOLTZ * ta**4,
+            cloud.Unsworth1975(THERMAL, AIR_TEMP, CLOUD_FACTOR),
+        )
+
+    def test_kimball_1982(self):
+        c = 1 - CLOUD_FACTOR
+        ta = AIR_TEMP + FREEZE
+        tc = ta - 11
+        f8 = -0.6732 + 0.6240e-2 * tc - 0.9140e-5 * tc**2
+        e8z = 0.24 + 2.98e-6 * VAPOR_PRESSURE**2 * np.exp(3000 / ta)
+        t8 = 1 - e8z * (1.4 - 0.4 * e8z)
+
+        npt.assert_allclose(
+            THERMAL + t8 * c * f8 * STEF_BOLTZ * tc**4,
+            cloud.Kimball1982(THERMAL, AIR_TEMP, VAPOR_PRESSURE, CLOUD_FACTOR),
+        )
+
+    def test_crawford_1999(self):
+        npt.assert_allclose(
+            (1 - CLOUD_FACTOR) * STEF_BOLTZ * (AIR_TEMP + FREEZE) ** 4
+            + CLOUD_FACTOR * THERMAL,
+            cloud.Crawford1999(THERMAL, AIR_TEMP, CLOUD_FACTOR),
+        )
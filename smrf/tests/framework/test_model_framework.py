@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -47,6 +48,12 @@ class TestModelFramework(SMRFTestCase):
     def test_assert_time_steps(self):
         self.assertEqual(self.smrf.time_steps, 5)
 
+    @patch("smrf.framework.model_framework.ne.set_num_threads")
+    def test_numexpr_threads(self, threads_mock):
+        SMRF(self.config_file)
+
+        threads_mock.assert_called_once_with(self.smrf.config["system"]["threads"])
+
     @patch("smrf.framework.model_framework.SMRF.output")
     @patch("smrf.framework.model_framework.SMRF.distribute_single_timestep")
     def test_distribute_data(self, mock_single_timestep, mock_output):
@@ -58,13 +65,62 @@ class TestModelFramework(SMRFTestCase):
         self.smrf.distribute["Variable"] = mock_variable
         self.smrf.distribute["Variable_2"] = mock_variable_2
         self.smrf.data = mock_data
+        executors = []
+        mock_single_timestep.side_effect = lambda _t: executors.append(
+            self.smrf._executor
+        )
 
         self.smrf.distribute_data()
 
         self.assertEqual(mock_single_timestep.call_count, self.smrf.time_steps)
+        self.assertIsNotNone(executors[0])
+        self.assertIsNone(self.smrf._executor)
         self.assertEqual(mock_output.call_count, self.smrf.time_steps)
 
         mock_variable_2.source_files.close.assert_called()
+        mock_output.assert_called_with(
+            self.smrf.date_time[-1], self.smrf.time_steps - 1
+        )
+
+    def test_output_frequency(self):
+        self.smrf.output_writer = MagicMock()
+        frequency = self.smrf.config["output"]["frequency"]
+        self.smrf.config["output"]["frequency"] = 3
+
+        try:
+            for output_count, t in enumerate(self.smrf.date_time):
+                self.smrf.output(t, output_count)
+        finally:
+            self.smrf.config["output"]["frequency"] = frequency
+
+        # Every third and the last of the five time steps
+        self.assertEqual(
+            [date_time[0][0] for date_time in
+             self.smrf.output_writer.output.call_args_list],
+            [self.smrf.date_time[0], self.smrf.date_time[3],
+             self.smrf.date_time[4]],
+        )
+
+    def test_output_in_background(self):
+        self.smrf.output_writer = MagicMock()
+        self.smrf.output_writer.variable_data.return_value = {"air_temp": None}
+
+        with ThreadPoolExecutor(max_workers=1) as self.smrf._output_executor:
+            self.smrf.output(self.smrf.date_time[0], 0)
+            self.smrf._wait_for_output()
+
+        self.smrf._output_executor = None
+
+        self.smrf.output_writer.output.assert_called_once_with(
+            self.smrf.date_time[0], {"air_temp": None}
+        )
+        self.assertIsNone(self.smrf._output_future)
+
+    def test_in_background(self):
+        function = MagicMock()
+
+        self.assertIsNone(self.smrf._in_background(function, 1, 2))
+        function.assert_called_once_with(1, 2)
 
 
 class TestModelFrameworkMST(SMRFTestCase):
@@ -174,6 +230,32 @@ class TestModelFrameworkLakes(SMRFTestCaseLakes):
                 distribution_class,
             )
 
+    @patch("smrf.framework.model_framework.AirTemperature")
+    def test_distribute_initialized_once(self, air_temp_mock):
+        air_temp_mock.DISTRIBUTION_KEY = distribute.AirTemperature.DISTRIBUTION_KEY
+        air_temp_mock.is_requested = distribute.AirTemperature.is_requested
+
+        self.smrf.create_distribution()
+
+        air_temp_mock.assert_called_once_with(config=self.smrf.config, topo=TOPO_MOCK)
+
+    def test_distribute_single_timestep_hrrr_thermal(self):
+        thermal = MagicMock(spec=distribute.ThermalHRRR)
+        air_temp = MagicMock(spec=distribute.AirTemperature)
+        self.smrf.data = MagicMock()
+        self.smrf.distribute = {
+            distribute.ThermalHRRR.DISTRIBUTION_KEY: thermal,
+            distribute.AirTemperature.DISTRIBUTION_KEY: air_temp,
+            distribute.SoilTemperature.DISTRIBUTION_KEY: MagicMock(),
+        }
+        timestep = self.smrf.date_time[0]
+
+        self.smrf.distribute_single_timestep(timestep)
+
+        thermal.distribute.assert_called_once_with(
+            timestep, self.smrf.data.thermal, air_temp.air_temp
+        )
+
     def test_distribute_hrrr_thermal(self):
         output_variables = ["hrrr_thermal"]
         config = self.base_config_copy()
@@ -39,6 +39,23 @@ class TestOutputNetCDF(SMRFTestCase):
             self.assertEqual(__version__, out_file.getncattr("SMRF_version"))
             self.assertTrue(out_file.variables["air_temp"].dtype == np.float32)
 
+    def test_variable_data(self):
+        self.variable_dict["air_temp"].air_temp = np.ones((2, 2))
+
+        variable_data = self.writer.variable_data()
+
+        npt.assert_equal(np.ones((2, 2)), variable_data["air_temp"])
+        self.assertIsNot(
+            self.variable_dict["air_temp"].air_temp, variable_data["air_temp"]
+        )
+
+    def test_netcdf_chunking(self):
+        with nc.Dataset(self.writer.file_name("air_temp")) as out_file:
+            self.assertEqual(
+                [1, self.smrf.topo.ny, self.smrf.topo.nx],
+                out_file.variables["air_temp"].chunking(),
+            )
+
     def test_netcdf_precision(self):
         self.writer.out_config["netcdf_output_precision"] = "double"
 
@@ -23,6 +23,7 @@ class TestWindNinjaRecipes(SMRFTestCaseLakes, BaseRecipes):
             'wind_ninja_tz',
             'wind_ninja_roughness',
             'wind_ninja_height',
+            'wind_ninja_weights',
             'min',
             'max'
         ]
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from smrf.spatial import InverseDistanceWeighted
+
+STATIONS_X = np.array([0.0, 20.0, 10.0])
+STATIONS_Y = np.array([0.0, 5.0, 30.0])
+GRID_X, GRID_Y = np.meshgrid(np.arange(0, 30.0, 10), np.arange(0, 40.0, 10))
+
+
+class TestInverseDistanceWeighted(unittest.TestCase):
+    def setUp(self):
+        self.subject = InverseDistanceWeighted(
+            STATIONS_X, STATIONS_Y, GRID_X, GRID_Y
+        )
+
+    def test_calculate_idw(self):
+        data = np.array([1.0, 2.0, 3.0])
+        weights = self.subject.weights
+
+        npt.assert_allclose(
+            np.sum(weights * data, 2) / np.sum(weights, 2),
+            self.subject.calculateIDW(data),
+        )
+
+    def test_calculate_idw_missing_data(self):
+        data = np.array([1.0, np.nan, 3.0])
+        weights = self.subject.weights[:, :, [0, 2]]
+
+        npt.assert_allclose(
+            np.sum(weights * data[[0, 2]], 2) / np.sum(weights, 2),
+            self.subject.calculateIDW(data),
+        )
+
+    def test_calculate_idw_missing_data_on_grid(self):
+        # The first station is on a grid cell and has an infinite weight there
+        data = np.array([np.nan, 2.0, 3.0])
+        weights = self.subject.weights[:, :, [1, 2]]
+
+        self.assertTrue(np.isinf(self.subject.weights[0, 0, 0]))
+        npt.assert_allclose(
+            np.sum(weights * data[[1, 2]], 2) / np.sum(weights, 2),
+            self.subject.calculateIDW(data),
+        )
+
+    def test_weights_sum(self):
+        nan_val = np.array([True, True, True])
+
+        weights_sum = self.subject.weightsSum(nan_val)
+
+        npt.assert_allclose(np.sum(self.subject.weights, 2), weights_sum)
+        self.assertIs(weights_sum, self.subject.weightsSum(nan_val.copy()))
+
+    def test_weights_sum_missing_data(self):
+        nan_val = np.array([True, False, True])
+
+        npt.assert_allclose(
+            np.sum(self.subject.weights[:, :, nan_val], 2),
+            self.subject.weightsSum(nan_val),
+        )
+        self.assertIsNone(self.subject._weights_sum)
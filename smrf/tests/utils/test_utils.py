@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as npt
+
+from smrf.utils.utils import read_asc_data, set_min_max
+
+ASC_FILE = """ncols 3
+nrows 2
+xllcorner 100.0
+yllcorner 200.0
+cellsize 50.0
+NODATA_value -9999
+1.1 2.25 3.333333333333333
+-4.0 5.5e-1 0.1
+"""
+
+
+class TestReadAscData(unittest.TestCase):
+    def test_read_asc_data(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            asc_file = Path(tmp_dir, "test_vel.asc")
+            asc_file.write_text(ASC_FILE)
+
+            data = read_asc_data(asc_file)
+
+            npt.assert_equal(np.loadtxt(asc_file, skiprows=6), data)
+            self.assertEqual((2, 3), data.shape)
+
+
+class TestSetMinMax(unittest.TestCase):
+    def test_set_min_max(self):
+        data = np.array([-1.0, 0.5, np.nan, 2.0])
+
+        result = set_min_max(data, 0, 1)
+
+        npt.assert_equal(np.array([0.0, 0.5, np.nan, 1.0]), result)
+        self.assertIs(data, result)
+
+    def test_set_min_max_none(self):
+        data = np.array([-1.0, 0.5, 2.0])
+
+        npt.assert_equal(
+            np.array([-1.0, 0.5, 1.0]), set_min_max(data.copy(), None, 1)
+        )
+        npt.assert_equal(
+            np.array([0.0, 0.5, 2.0]), set_min_max(data.copy(), 0, None)
+        )
+        npt.assert_equal(data, set_min_max(data.copy(), None, None))
@@ -146,19 +146,11 @@ def set_min_max(data, min_val, max_val):
     Returns:
         data: numpy array of data trimmed at min_val and max_val
     """
-    if max_val is None:
-        max_val = np.inf
-    if min_val is None:
-        min_val = -np.inf
+    if min_val is None and max_val is None:
+        return data
 
-    ind = np.isnan(data)
-
-    data[data <= min_val] = min_val
-    data[data >= max_val] = max_val
-
-    data[ind] = np.nan
-
-    return data
+    # Clipped in place with one pass, NaN values are kept
+    return np.clip(data, min_val, max_val, out=data)
 
 
 def water_day(indate):
@@ -364,6 +356,27 @@ def get_asc_stats(fp):
     return ts
 
 
+def read_asc_data(fp):
+    """
+    Returns the data of an ascii grid file. The values are parsed with the
+    pandas C parser, rounded the same as np.loadtxt.
+
+    Args:
+        fp: path to the ascii grid file
+
+    Returns:
+        2D numpy array of the grid values
+    """
+    return pd.read_csv(
+        fp,
+        skiprows=6,
+        header=None,
+        sep=r'\s+',
+        dtype=np.float64,
+        float_precision='round_trip',
+    ).to_numpy()
+
+
 def getqotw():
     p = os.path.dirname(__core_config__)
     q_f = os.path.abspath(os.path.join('{0}'.format(p), '.qotw'))
@@ -404,7 +417,7 @@ def interp_weights(xy, uv, d=2):
     return vertices, np.hstack((bary, 1 - bary.sum(axis=1, keepdims=True)))
 
 
-def grid_interpolate(values, vtx, wts, shp, fill_value=np.nan):
+def grid_interpolate(values, vtx, wts, shp, fill_value=np.nan, out=None):
     """
     Broken out gridded interpolation from scipy.interpolate.griddata that takes
     the vertices and wts from interp_weights function
@@ -415,11 +428,16 @@ def grid_interpolate(values, vtx, wts, shp, fill_value=np.nan):
         wts:    weights for interpolation
         shape:  shape of SMRF grid
         fill_value: value for extrapolated points
+        out:    optional C-contiguous array with the shape of the SMRF grid
+                to write the interpolated values to
 
     Returns:
         ret:    interpolated values
     """
-    ret = np.einsum('nj,nj->n', np.take(values, vtx), wts)
+    if out is not None:
+        out = out.reshape(-1)
+
+    ret = np.einsum('nj,nj->n', np.take(values, vtx), wts, out=out)
     ret[np.any(wts < 0, axis=1)] = fill_value
 
     ret = ret.reshape(shp[0], shp[1])